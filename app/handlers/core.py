@@ -1,8 +1,10 @@
+import asyncio
 import html
 import re
 from io import BytesIO
 import urllib.parse
 
+import orjson
 from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
@@ -14,9 +16,13 @@ from app.services.tmdb import extract_title_year_from_filename, strict_match, pi
 from app.state import ALLOWED_USERS, AUTHORIZED_CHATS, UCER_SETTINGS, BOT_CONFIG, track_user, save_state
 from app.utils import (
     is_gdrive_link, is_workers_link, extract_drive_id, extract_drive_id_from_workers,
-    extract_workers_path, human_readable_size, strip_extension, get_remote_size, download_bytes
+    extract_workers_path, human_readable_size, strip_extension, get_remote_size, download_bytes,
+    SESSION,
 )
 
+# Tightens "Title - [..]" to "Title [..]" on each caption line
+_DASH_BRACKET_RE = re.compile(r"\s*-\s*\[")
+
 # ---------- Progress helpers (bold + 10-step bar) ----------
 def _progress_bar(percent: int) -> str:
     
@@ -221,7 +227,7 @@ async def get_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         final_title, final_year, poster_url = "Unknown", "????", None
         if first_name_for_tmdb:
             base_title, file_year = extract_title_year_from_filename(first_name_for_tmdb)
-            t_title, t_year, t_lang, poster_url, tmdb_url = strict_match(base_title, file_year)
+            t_title, t_year, t_lang, poster_url, tmdb_url = await asyncio.to_thread(strict_match, base_title, file_year)
             final_title = t_title or base_title or "Unknown"
             final_year = t_year or file_year or "????"
 
@@ -254,7 +260,7 @@ async def get_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         try: await status_msg.delete()
         except Exception: pass
 
-        poster_bytes = download_bytes(poster_url) if poster_url else None
+        poster_bytes = await asyncio.to_thread(download_bytes, poster_url) if poster_url else None
         if poster_bytes:
             bio = BytesIO(poster_bytes); bio.name = "poster.jpg"
             await update.message.reply_photo(photo=bio, caption=msg, parse_mode=ParseMode.HTML)
@@ -303,7 +309,7 @@ async def info_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         filename = urllib.parse.unquote(urllib.parse.urlparse(url).path.rsplit("/", 1)[-1]) or "Unknown"
         base_title, file_year = extract_title_year_from_filename(filename)
-        tmdb_title, tmdb_year, tmdb_lang_code, poster_url, tmdb_url = strict_match(base_title, file_year)
+        tmdb_title, tmdb_year, tmdb_lang_code, poster_url, tmdb_url = await asyncio.to_thread(strict_match, base_title, file_year)
         final_title = tmdb_title or base_title or "Unknown"
         final_year = tmdb_year or file_year or "????"
 
@@ -319,7 +325,7 @@ async def info_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         try: await status_msg.delete()
         except Exception: pass
 
-        poster_bytes = download_bytes(poster_url) if poster_url else None
+        poster_bytes = await asyncio.to_thread(download_bytes, poster_url) if poster_url else None
         if poster_bytes:
             bio = BytesIO(poster_bytes); bio.name = "poster.jpg"
             await update.message.reply_photo(photo=bio, caption=msg, parse_mode=ParseMode.HTML)
@@ -397,11 +403,11 @@ async def ls_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await status_msg.edit_text(_progress_text(70), parse_mode=ParseMode.HTML)
 
         base_title, file_year = extract_title_year_from_filename(raw_name)
-        tmdb_title, tmdb_year, tmdb_lang_code, poster_url_unused, tmdb_url = strict_match(base_title, file_year)
+        tmdb_title, tmdb_year, tmdb_lang_code, poster_url_unused, tmdb_url = await asyncio.to_thread(strict_match, base_title, file_year)
         final_title = tmdb_title or base_title or "Unknown"
         final_year = tmdb_year or file_year or "????"
 
-        backdrop_url = backdrop_from_tmdb_url(tmdb_url) if tmdb_url else None
+        backdrop_url = await asyncio.to_thread(backdrop_from_tmdb_url, tmdb_url) if tmdb_url else None
 
         await status_msg.edit_text(_progress_text(90), parse_mode=ParseMode.HTML)
 
@@ -415,7 +421,7 @@ async def ls_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         try: await status_msg.delete()
         except Exception: pass
 
-        poster_bytes = download_bytes(backdrop_url) if backdrop_url else None
+        poster_bytes = await asyncio.to_thread(download_bytes, backdrop_url) if backdrop_url else None
         if poster_bytes:
             bio = BytesIO(poster_bytes); bio.name = "backdrop.jpg"
             await update.message.reply_photo(photo=bio, caption=msg, parse_mode=ParseMode.HTML)
@@ -441,7 +447,7 @@ async def tmdb_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         status_msg = await update.message.reply_text(_progress_text(10), parse_mode=ParseMode.HTML)
 
         if raw.startswith("http") and "themoviedb.org" in raw:
-            import re, requests
+            import re
             from app.config import TMDB_API_KEY
             m = re.search(r"themoviedb\.org/(movie|tv)/(\d+)", raw)
             if not m:
@@ -450,14 +456,14 @@ async def tmdb_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 await update.message.reply_text("Invalid TMDB URL."); return
             ctype, tmdb_id = m.group(1), m.group(2)
             api_url = f"https://api.themoviedb.org/3/{ctype}/{tmdb_id}"
-            r = requests.get(api_url, params={"api_key": TMDB_API_KEY}, timeout=10)
+            r = await asyncio.to_thread(SESSION.get, api_url, params={"api_key": TMDB_API_KEY}, timeout=10)
             await status_msg.edit_text(_progress_text(50), parse_mode=ParseMode.HTML)
             if r.status_code != 200:
                 try: await status_msg.delete()
                 except Exception: pass
                 await update.message.reply_text(f"TMDB error: HTTP {r.status_code}")
                 return
-            data = r.json()
+            data = orjson.loads(r.content)
             tmdb_title = data.get("title") or data.get("name") or "Unknown"
             if data.get("release_date"): tmdb_year = data["release_date"][:4]
             elif data.get("first_air_date"): tmdb_year = data["first_air_date"][:4]
@@ -472,7 +478,7 @@ async def tmdb_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 title = raw[:m.start()].strip()
             else:
                 year = "????"
-            t_title, t_year, t_lang, poster_url, tmdb_url = strict_match(title, year)
+            t_title, t_year, t_lang, poster_url, tmdb_url = await asyncio.to_thread(strict_match, title, year)
             await status_msg.edit_text(_progress_text(70), parse_mode=ParseMode.HTML)
             tmdb_title = t_title or title or "Unknown"
             tmdb_year = t_year or year or "????"
@@ -482,7 +488,7 @@ async def tmdb_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         except Exception: pass
 
         header = f"<b>🎬 {html.escape(tmdb_title)} - ({html.escape(tmdb_year)})</b>"
-        poster_bytes = download_bytes(poster_url) if poster_url else None
+        poster_bytes = await asyncio.to_thread(download_bytes, poster_url) if poster_url else None
         if poster_bytes:
             bio = BytesIO(poster_bytes); bio.name = "poster.jpg"
             await update.message.reply_photo(photo=bio, caption=header, parse_mode=ParseMode.HTML)
@@ -509,7 +515,7 @@ async def manual_poster(update: Update, context: ContextTypes.DEFAULT_TYPE):
     from app.utils import ensure_line_bold
     lines = []
     for l in base.splitlines():
-        s = re.sub(r"\s*-\s*\[", " [", l)
+        s = _DASH_BRACKET_RE.sub(" [", l)
         lines.append(ensure_line_bold(s) if s.strip() else "")
     caption_to_send = "\n".join(lines)
     photo = msg.photo[-1]
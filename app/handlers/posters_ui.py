@@ -1,15 +1,17 @@
+import asyncio
 import html
-from io import BytesIO
+import itertools
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple
 
-import requests
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputMediaPhoto
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputFile, InputMediaPhoto
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, TelegramError
 from telegram.ext import ContextTypes
 
-from app.config import TMDB_API_KEY
 from app.state import track_user
-from app.utils import download_bytes
+from app.services import tmdb_async
 from app.services.tmdb import LANG_MAP
 
 TMDB_IMG = "https://image.tmdb.org/t/p/original"
@@ -24,167 +26,381 @@ FIXED_LANGS = [
     ("ml", "Malayalam"),
     ("kn", "Kannada"),
 ]
+_FIXED_KEYS = frozenset(c for c, _ in FIXED_LANGS)
 
+# Callback data is "p:<step>:..." with 1-char codes to stay well inside Telegram's
+# 64-byte limit: steps x/s/t/l/v, ctype m(ovie)/t(v), imgtype b(ackdrop)/p(oster)/m(enu).
+# Messages sent before the switch still carry "poster:<step>:..." with full words.
+_CTYPE_CODE = {"movie": "m", "tv": "t"}
+_IMGTYPE_CODE = {"backdrop": "b", "poster": "p", "menu": "m"}
+_CTYPE_NAME = {v: k for k, v in _CTYPE_CODE.items()}
+_IMGTYPE_NAME = {v: k for k, v in _IMGTYPE_CODE.items()}
+
+def _cb_type(ctype: str, tmdb_id: str, imgtype: str) -> str:
+    return "p:t:" + _CTYPE_CODE.get(ctype, ctype) + ":" + tmdb_id + ":" + _IMGTYPE_CODE.get(imgtype, imgtype)
+
+# Shared by every poster keyboard (buttons are immutable)
+_CLOSE_BTN = InlineKeyboardButton("❌ Close", callback_data="p:x")
+
+# Small LRU of downloaded image bytes. Only filled when Telegram refuses a URL (see
+# _send_poster), so paging back to such an image doesn't download it again.
+_IMG_CACHE: "OrderedDict[str, bytes]" = OrderedDict()
+_IMG_CACHE_MAX_BYTES = 32 * 1024 * 1024  # originals vary from ~100 KB to several MB
+_img_cache_bytes = 0
+
+# TMDB image URL -> Telegram file_id of a photo we already sent; resending by id
+# costs Telegram no fetch and us no upload. In-process only (ids are cheap to relearn).
+_FILE_IDS: "OrderedDict[str, str]" = OrderedDict()
+_FILE_IDS_MAX = 4096
+
+# Filtered image lists remembered per user, see _remember_pages
+_PAGE_STATE_MAX = 32
+_TITLES_MAX = 64
+
+# (user_id, callback_data) -> future resolved when the first press finishes
+_INFLIGHT: Dict[Tuple[int, str], asyncio.Future] = {}
+
+@lru_cache(maxsize=512)
 def _lang_label(code: Optional[str]) -> str:
     if not code or code == "none":
         return "No Language"
     code = code.lower()
     return LANG_MAP.get(code, code.upper())
 
-def _tmdb_details(tmdb_id: str) -> Tuple[str, str, str]:
-    """Return (ctype, title, year) where ctype is 'movie' or 'tv'. Try movie first, then tv."""
-    # Movie
-    try:
-        r = requests.get(f"https://api.themoviedb.org/3/movie/{tmdb_id}",
-                         params={"api_key": TMDB_API_KEY}, timeout=10)
-        if r.status_code == 200:
-            d = r.json()
-            title = d.get("title") or d.get("name") or "Unknown"
-            year = d.get("release_date")[:4] if d.get("release_date") else "????"
-            return "movie", title, year
-    except Exception:
-        pass
-    # TV
-    try:
-        r = requests.get(f"https://api.themoviedb.org/3/tv/{tmdb_id}",
-                         params={"api_key": TMDB_API_KEY}, timeout=10)
-        if r.status_code == 200:
-            d = r.json()
-            title = d.get("name") or d.get("title") or "Unknown"
-            year = d.get("first_air_date")[:4] if d.get("first_air_date") else "????"
-            return "tv", title, year
-    except Exception:
-        pass
-    return "movie", "Unknown", "????"
+def _movie_details(d: dict) -> Tuple[str, str, str]:
+    title = d.get("title") or d.get("name") or "Unknown"
+    year = d.get("release_date")[:4] if d.get("release_date") else "????"
+    return "movie", title, year
+
+def _tv_details(d: dict) -> Tuple[str, str, str]:
+    title = d.get("name") or d.get("title") or "Unknown"
+    year = d.get("first_air_date")[:4] if d.get("first_air_date") else "????"
+    return "tv", title, year
 
-def _tmdb_images(tmdb_id: str, ctype: str) -> Dict[str, List[dict]]:
+async def _fetch_details(tmdb_id: str) -> Optional[Tuple[str, str, str]]:
+    movie_task = asyncio.ensure_future(tmdb_async.get_json(f"/movie/{tmdb_id}"))
+    tv_task = asyncio.ensure_future(tmdb_async.get_json(f"/tv/{tmdb_id}"))
+    try:
+        # Ids come from /search/movie, so a movie hit usually lands first: don't wait for TV then
+        await asyncio.wait((movie_task, tv_task), return_when=asyncio.FIRST_COMPLETED)
+        if movie_task.done() and not movie_task.exception() and movie_task.result()[1] is not None:
+            return _movie_details(movie_task.result()[1])
+        # Movie still pending or missing; it keeps priority when both exist
+        await asyncio.wait((movie_task, tv_task))
+        for task, parse in ((movie_task, _movie_details), (tv_task, _tv_details)):
+            if not task.exception() and task.result()[1] is not None:
+                return parse(task.result()[1])
+        return None
+    finally:
+        for task in (movie_task, tv_task):
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                task.exception()  # retrieved, so a failed probe isn't logged as unhandled
+
+async def _tmdb_details(tmdb_id: str) -> Tuple[str, str, str]:
     """
-    Fetch images for id/type. Returns dict with keys 'backdrops' and 'posters'.
-    NOTE: Do NOT restrict include_image_language so we get all languages.
+    Return (ctype, title, year) where ctype is 'movie' or 'tv'.
+    Movie and TV are probed concurrently; movie wins when both exist.
+    Successful lookups are cached for a day.
     """
-    data = {"backdrops": [], "posters": []}
+    got = await tmdb_async.cached(
+        ("details", tmdb_id), tmdb_async.DETAILS_TTL, lambda: _fetch_details(tmdb_id)
+    )
+    return got or ("movie", "Unknown", "????")
+
+async def _fetch_images(tmdb_id: str, ctype: str, lang: Optional[str]) -> Optional[Dict[str, List[dict]]]:
+    params = {}
+    if lang:
+        # "xx" is untagged too as far as _lang_key is concerned
+        params["include_image_language"] = "null,xx" if lang == "none" else f"{lang},null,xx"
     try:
-        r = requests.get(
-            f"https://api.themoviedb.org/3/{ctype}/{tmdb_id}/images",
-            params={"api_key": TMDB_API_KEY},
-            timeout=10,
-        )
-        if r.status_code == 200:
-            js = r.json() or {}
-            data["backdrops"] = js.get("backdrops") or []
-            data["posters"] = js.get("posters") or []
+        _, js = await tmdb_async.get_json(f"/{ctype}/{tmdb_id}/images", **params)
     except Exception:
-        pass
-    return data
+        return None
+    if not isinstance(js, dict):
+        return None
+    return _images_payload(js)
+
+def _images_payload(js: dict) -> Dict[str, List[dict]]:
+    backdrops = js.get("backdrops") or []
+    posters = js.get("posters") or []
+    return {
+        "backdrops": backdrops,
+        "posters": posters,
+        "by_lang_backdrops": _bucket_by_lang(backdrops),
+        "by_lang_posters": _bucket_by_lang(posters),
+    }
+
+async def _tmdb_images(tmdb_id: str, ctype: str, lang: Optional[str] = None) -> Dict[str, List[dict]]:
+    """
+    Fetch images for id/type. Returns dict with keys 'backdrops' and 'posters', plus
+    'by_lang_backdrops' / 'by_lang_posters' mapping language key -> items.
+    Without `lang` all languages are returned (needed for the language keyboard).
+    With `lang` TMDB filters server-side to that language plus untagged images,
+    which is all the pick/paging steps need. Cached for an hour.
+    """
+    got = await tmdb_async.cached(
+        ("images", ctype, tmdb_id, lang), tmdb_async.IMAGES_TTL, lambda: _fetch_images(tmdb_id, ctype, lang)
+    )
+    return got or {"backdrops": [], "posters": [], "by_lang_backdrops": {}, "by_lang_posters": {}}
+
+async def _title_info(context: ContextTypes.DEFAULT_TYPE, tmdb_id: str) -> Tuple[str, str, str]:
+    """(ctype, title, year) remembered per user from the select step; TMDB only on a miss."""
+    titles: Dict[str, Tuple[str, str, str]] = context.user_data.setdefault("poster_titles", {})
+    got = titles.get(tmdb_id)
+    if got is None:
+        got = await _tmdb_details(tmdb_id)
+        if got[1:] != ("Unknown", "????"):
+            titles[tmdb_id] = got
+            while len(titles) > _TITLES_MAX:
+                del titles[next(iter(titles))]
+    return got
+
+def _remember_pages(context: ContextTypes.DEFAULT_TYPE, key: tuple, value: tuple) -> None:
+    """
+    Per-user LRU of (items, caption_head) per selection, so paging needs no
+    TMDB calls and no re-escaping of title/year/language.
+    """
+    pages = context.user_data.setdefault("poster_pages", OrderedDict())
+    pages[key] = value
+    pages.move_to_end(key)
+    while len(pages) > _PAGE_STATE_MAX:
+        pages.popitem(last=False)
+
+def _recall_pages(context: ContextTypes.DEFAULT_TYPE, key: tuple) -> Optional[tuple]:
+    pages = context.user_data.get("poster_pages")
+    if not pages or key not in pages:
+        return None
+    pages.move_to_end(key)
+    return pages[key]
+
+def _lang_key(it: dict) -> str:
+    code = (it.get("iso_639_1") or "").lower()
+    return "none" if code in ("", "xx") else code
+
+def _bucket_by_lang(items: List[dict]) -> Dict[str, List[dict]]:
+    """Group images by language key in one pass; 'none' collects no/xx/empty language."""
+    buckets: Dict[str, List[dict]] = {}
+    for it in items:
+        buckets.setdefault(_lang_key(it), []).append(it)
+    return buckets
+
+def _img_cache_put(url: str, img: bytes) -> None:
+    global _img_cache_bytes
+    old = _IMG_CACHE.pop(url, None)
+    if old is not None:
+        _img_cache_bytes -= len(old)
+    _IMG_CACHE[url] = img
+    _img_cache_bytes += len(img)
+    while _img_cache_bytes > _IMG_CACHE_MAX_BYTES and len(_IMG_CACHE) > 1:
+        _, evicted = _IMG_CACHE.popitem(last=False)
+        _img_cache_bytes -= len(evicted)
+
+def _remember_file_id(url: str, sent) -> None:
+    photo = getattr(sent, "photo", None)
+    if not photo:
+        return
+    _FILE_IDS[url] = photo[-1].file_id
+    _FILE_IDS.move_to_end(url)
+    while len(_FILE_IDS) > _FILE_IDS_MAX:
+        _FILE_IDS.popitem(last=False)
+
+async def _get_image_bytes(url: str) -> Optional[bytes]:
+    """Return image bytes from the LRU, downloading over the shared session on miss."""
+    img = _IMG_CACHE.get(url)
+    if img is not None:
+        _IMG_CACHE.move_to_end(url)
+        return img
+    img = await tmdb_async.download_bytes_async(url)
+    if img:
+        _img_cache_put(url, img)
+    return img
+
+def _type_menu_kb(ctype: str, tmdb_id: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [
+            InlineKeyboardButton("Landscape", callback_data=_cb_type(ctype, tmdb_id, "backdrop")),
+            InlineKeyboardButton("Portrait", callback_data=_cb_type(ctype, tmdb_id, "poster")),
+        ],
+        [_CLOSE_BTN],
+    ])
 
-def _filter_items_by_lang(items: List[dict], langkey: str) -> List[dict]:
-    """Filter images by language key; 'none' means no/xx/empty language."""
-    if not items:
-        return []
-    if langkey == "none":
-        out = []
-        for it in items:
-            code = it.get("iso_639_1")
-            if not code or code in ("", "xx"):
-                out.append(it)
-        return out
-    langkey = langkey.lower()
-    return [it for it in items if (it.get("iso_639_1") or "").lower() == langkey]
-
-def _build_language_keyboard(items: List[dict], ctype: str, tmdb_id: str, imgtype: str) -> InlineKeyboardMarkup:
+@lru_cache(maxsize=512)
+def _back_close_kb(ctype: str, tmdb_id: str) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup([
+        [InlineKeyboardButton("⬅ Back", callback_data=_cb_type(ctype, tmdb_id, "menu"))],
+        [_CLOSE_BTN],
+    ])
+
+def _build_language_keyboard(by_lang: Dict[str, List[dict]], ctype: str, tmdb_id: str, imgtype: str) -> InlineKeyboardMarkup:
     """
     Build language selection keyboard:
     - Always show the fixed set requested (No Language, English, Tamil, Telugu, Hindi, Malayalam, Kannada)
     - Also append any other languages actually present for this title/type
     """
-    present_codes: set[str] = set()
-    for it in items:
-        code = it.get("iso_639_1")
-        if not code or code in ("", "xx"):
-            present_codes.add("none")
-        else:
-            present_codes.add(code.lower())
-
-    # Start with fixed set (always present as buttons)
-    buttons: List[List[InlineKeyboardButton]] = []
-    row: List[InlineKeyboardButton] = []
-    for code, label in FIXED_LANGS:
-        cb = f"poster:lang:{ctype}:{tmdb_id}:{imgtype}:{code}"
-        row.append(InlineKeyboardButton(label, callback_data=cb))
-        if len(row) == 2:
-            buttons.append(row); row = []
-    if row:
-        buttons.append(row); row = []
-
-    # Add any additional languages present in TMDB results but not in fixed list
-    fixed_keys = {c for c, _ in FIXED_LANGS}
-    extras = sorted([c for c in present_codes if c not in fixed_keys and c])
-    for code in extras:
-        label = _lang_label(code)
-        cb = f"poster:lang:{ctype}:{tmdb_id}:{imgtype}:{code}"
-        row.append(InlineKeyboardButton(label, callback_data=cb))
-        if len(row) == 2:
-            buttons.append(row); row = []
-    if row:
-        buttons.append(row); row = []
+    return _language_keyboard_cached(frozenset(by_lang), ctype, tmdb_id, imgtype)
+
+@lru_cache(maxsize=1024)
+def _language_keyboard_cached(present_codes: frozenset, ctype: str, tmdb_id: str, imgtype: str) -> InlineKeyboardMarkup:
+    prefix = "p:l:" + _CTYPE_CODE.get(ctype, ctype) + ":" + tmdb_id + ":" + _IMGTYPE_CODE.get(imgtype, imgtype) + ":"
+
+    def btn(code: str, label: str) -> InlineKeyboardButton:
+        return InlineKeyboardButton(label, callback_data=prefix + code)
+
+    # Fixed set first (always present as buttons), then extra TMDB languages; two per row
+    fixed = [btn(code, label) for code, label in FIXED_LANGS]
+    extras = [btn(code, _lang_label(code)) for code in sorted(c for c in present_codes if c and c not in _FIXED_KEYS)]
+    buttons = [fixed[i:i + 2] for i in range(0, len(fixed), 2)]
+    buttons += [extras[i:i + 2] for i in range(0, len(extras), 2)]
 
     # Navigation
     buttons.append([
-        InlineKeyboardButton("⬅ Back", callback_data=f"poster:type:{ctype}:{tmdb_id}:menu"),
-        InlineKeyboardButton("❌ Close", callback_data="poster:close"),
+        InlineKeyboardButton("⬅ Back", callback_data=_cb_type(ctype, tmdb_id, "menu")),
+        _CLOSE_BTN,
     ])
     return InlineKeyboardMarkup(buttons)
 
-def _page_nav_row(total: int, index: int, ctype: str, tmdb_id: str, imgtype: str, langkey: str) -> List[InlineKeyboardButton]:
-    def cb(i: int) -> str:
-        return f"poster:view:{ctype}:{tmdb_id}:{imgtype}:{langkey}:{i}"
+def _page_nav_row(total: int, index: int, prefix: str) -> List[InlineKeyboardButton]:
+    prev_i = index - 1 if index > 0 else 0
+    next_i = index + 1 if index < total - 1 else total - 1
     return [
-        InlineKeyboardButton("<<", callback_data=cb(0)),
-        InlineKeyboardButton("<", callback_data=cb(max(0, index - 1))),
-        InlineKeyboardButton(f"{index+1}/{total}", callback_data=cb(index)),
-        InlineKeyboardButton(">", callback_data=cb(min(total - 1, index + 1))),
-        InlineKeyboardButton(">>", callback_data=cb(total - 1)),
+        InlineKeyboardButton("<<", callback_data=prefix + "0"),
+        InlineKeyboardButton("<", callback_data=prefix + str(prev_i)),
+        InlineKeyboardButton(f"{index+1}/{total}", callback_data=prefix + str(index)),
+        InlineKeyboardButton(">", callback_data=prefix + str(next_i)),
+        InlineKeyboardButton(">>", callback_data=prefix + str(total - 1)),
     ]
 
-def _page_numbers_row(total: int, index: int, ctype: str, tmdb_id: str, imgtype: str, langkey: str) -> List[InlineKeyboardButton]:
+def _page_numbers_row(total: int, index: int, prefix: str) -> List[InlineKeyboardButton]:
     """
     Numbered buttons 1..N like user requested.
     Show up to 6 numbers centered around current index.
     """
-    def cb(i: int) -> str:
-        return f"poster:view:{ctype}:{tmdb_id}:{imgtype}:{langkey}:{i}"
     if total <= 6:
         start, end = 0, total
     else:
-        start = max(0, index - 2)
-        end = min(total, start + 6)
+        start = index - 2 if index > 2 else 0
+        end = start + 6 if start + 6 < total else total
         if end - start < 6:
-            start = max(0, end - 6)
-    row: List[InlineKeyboardButton] = []
-    for i in range(start, end):
-        label = str(i + 1)
-        row.append(InlineKeyboardButton(label, callback_data=cb(i)))
-    return row
+            start = end - 6
+    return [InlineKeyboardButton(str(i + 1), callback_data=prefix + str(i)) for i in range(start, end)]
 
 def _paging_keyboard(total: int, index: int, ctype: str, tmdb_id: str, imgtype: str, langkey: str) -> InlineKeyboardMarkup:
-    rows: List[List[InlineKeyboardButton]] = []
-    rows.append(_page_nav_row(total, index, ctype, tmdb_id, imgtype, langkey))
-    rows.append(_page_numbers_row(total, index, ctype, tmdb_id, imgtype, langkey))
-    rows.append([
-        InlineKeyboardButton("Back", callback_data=f"poster:type:{ctype}:{tmdb_id}:menu"),
-        InlineKeyboardButton("Close", callback_data="poster:close"),
+    # Shared "p:v:...:" prefix; each button only appends its index
+    prefix = "p:v:" + _CTYPE_CODE.get(ctype, ctype) + ":" + tmdb_id + ":" + _IMGTYPE_CODE.get(imgtype, imgtype) + ":" + langkey + ":"
+    return InlineKeyboardMarkup([
+        _page_nav_row(total, index, prefix),
+        _page_numbers_row(total, index, prefix),
+        [
+            InlineKeyboardButton("Back", callback_data=_cb_type(ctype, tmdb_id, "menu")),
+            InlineKeyboardButton("Close", callback_data="p:x"),
+        ],
     ])
-    return InlineKeyboardMarkup(rows)
-
-def _build_caption(title: str, year: str, imgtype: str, lang_name: str, width: int | str, height: int | str, url: str) -> str:
-    # Matches the sample: bold lines, bullets, and Click Here link
-    return (
-        f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n"
-        f"<b>• Type : {'Landscape' if imgtype == 'backdrop' else 'Portrait'}</b>\n\n"
-        f"<b>• Language: {html.escape(lang_name)}</b>\n\n"
-        f"<b>• Width: {html.escape(str(width))}, Height: {html.escape(str(height))}</b>\n\n"
-        f"<b>• <a href='{html.escape(url)}'>Click Here</a></b>"
-    )
+
+# Caption = head (constant for one language selection) + tail (per image)
+_CAPTION_HEAD_TMPL = (
+    "<b>{te} ({ye})</b>\n\n"
+    "<b>• Type : {tp}</b>\n\n"
+    "<b>• Language: {ln}</b>\n\n"
+)
+_CAPTION_TAIL_TMPL = (
+    "<b>• Width: {w}, Height: {h}</b>\n\n"
+    "<b>• <a href='{u}'>Click Here</a></b>"
+)
+
+@lru_cache(maxsize=256)
+def _escaped_title_year(title: str, year: str) -> Tuple[str, str]:
+    return html.escape(title), html.escape(year)
+
+@lru_cache(maxsize=512)
+def _escaped_lang_label(langkey: str) -> str:
+    return html.escape(_lang_label(langkey))
+
+def _caption_head(title: str, year: str, imgtype: str, langkey: str) -> str:
+    te, ye = _escaped_title_year(title, year)
+    return _CAPTION_HEAD_TMPL.format_map({
+        "te": te,
+        "ye": ye,
+        "tp": "Landscape" if imgtype == "backdrop" else "Portrait",
+        "ln": _escaped_lang_label(langkey),
+    })
+
+def _build_caption(head: str, width: int | str, height: int | str, url: str) -> str:
+    # Matches the sample: bold lines, bullets, and Click Here link.
+    # Width/height are TMDB ints or "Unknown" and never need escaping; the URL
+    # embeds a TMDB file path inside href='...', so it still goes through escape.
+    return head + _CAPTION_TAIL_TMPL.format_map({
+        "w": width,
+        "h": height,
+        "u": html.escape(url),
+    })
+
+async def _edit_or_reply(msg, text: str, **kw):
+    """
+    Edit `msg` in place; reply with a new message only when the edit really failed
+    (e.g. the message is a photo). 'Message is not modified' is benign and ends here.
+    """
+    try:
+        return await msg.edit_text(text, **kw)
+    except BadRequest as e:
+        if "not modified" in str(e).lower():
+            return None
+    except TelegramError:
+        pass
+    try:
+        return await msg.reply_text(text, **kw)
+    except TelegramError:
+        return None
+
+_URL_FETCH_ERRORS = (
+    "webpage_media_empty",
+    "wrong file identifier/http url",
+    "failed to get http url content",
+    "wrong type of the web page content",
+    "photo_invalid_dimensions",
+    "too big",
+)
+
+def _is_url_fetch_error(e: BadRequest) -> bool:
+    msg = str(e).lower()
+    return any(k in msg for k in _URL_FETCH_ERRORS)
+
+async def _strip_keyboard(msg) -> None:
+    try:
+        await msg.edit_reply_markup(reply_markup=None)
+    except TelegramError:
+        pass
+
+async def _send_poster(chat, url: str, caption: str, kb: InlineKeyboardMarkup):
+    """
+    Send a poster as a new photo. A file_id from an earlier send is reused when known;
+    otherwise Telegram is handed the TMDB URL so it fetches server-side. Only if it
+    rejects that (BadRequest, e.g. >5 MB or fetch failure) are the bytes downloaded
+    and uploaded, and text is the last resort.
+    """
+    file_id = _FILE_IDS.get(url)
+    if file_id:
+        try:
+            return await chat.send_photo(photo=file_id, caption=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
+        except BadRequest:
+            _FILE_IDS.pop(url, None)
+    try:
+        sent = await chat.send_photo(photo=url, caption=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
+        _remember_file_id(url, sent)
+        return sent
+    except BadRequest as e:
+        # Only Telegram failing to fetch/accept the URL is worth a local download;
+        # anything else (bad caption, chat gone) would fail the upload the same way
+        if not _is_url_fetch_error(e):
+            raise
+    img = await _get_image_bytes(url)
+    if img:
+        # InputFile wraps the cached bytes as-is; no BytesIO copy of a multi-MB original
+        sent = await chat.send_photo(photo=InputFile(img, filename="poster.jpg"), caption=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
+        _remember_file_id(url, sent)
+        return sent
+    return await chat.send_message(text=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
 
 async def posters_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_user:
@@ -194,221 +410,240 @@ async def posters_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Usage:\n/posters movie name [year]")
         return
     try:
-        url = "https://api.themoviedb.org/3/search/movie"
-        params = {"api_key": TMDB_API_KEY, "query": query, "page": 1, "include_adult": "false"}
-        r = requests.get(url, params=params, timeout=10)
-        if r.status_code != 200:
-            await update.message.reply_text(f"TMDB error: HTTP {r.status_code}")
+        status, js = await tmdb_async.get_json("/search/movie", query=query, page=1, include_adult="false")
+        if status != 200:
+            await update.message.reply_text(f"TMDB error: HTTP {status}")
             return
-        data = r.json().get("results", [])[:10]
+        results = (js or {}).get("results") or ()
     except Exception as e:
         await update.message.reply_text(f"❌ TMDB search failed:\n<code>{html.escape(str(e))}</code>", parse_mode=ParseMode.HTML)
         return
-    if not data:
-        await update.message.reply_text("❌ No results found"); return
 
-    buttons = []
-    for m in data:
-        title = m.get("title") or m.get("name") or "Unknown"
-        year = (m.get("release_date") or "????")[:4]
-        mid = m.get("id")
-        if not mid:
-            continue
-        buttons.append([InlineKeyboardButton(f"{title} ({year})", callback_data=f"poster:select:{mid}")])
-    buttons.append([InlineKeyboardButton("❌ Close", callback_data="poster:close")])
+    # First 10 results that actually have an id, in one pass
+    valid = (
+        (m.get("title") or m.get("name") or "Unknown", (m.get("release_date") or "????")[:4], m["id"])
+        for m in results if m.get("id")
+    )
+    buttons = [
+        [InlineKeyboardButton(f"{title} ({year})", callback_data="p:s:" + str(mid))]
+        for title, year, mid in itertools.islice(valid, 10)
+    ]
+    if not buttons:
+        await update.message.reply_text("❌ No results found"); return
+    buttons.append([_CLOSE_BTN])
     await update.message.reply_text("Search Results :", reply_markup=InlineKeyboardMarkup(buttons))
 
 async def posters_cb(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    # main.callback_router has already answered the query; a second answer is
+    # just another round trip in front of the real work
     q = update.callback_query
-    await q.answer()
     data = (q.data or "")
 
-    # Close the UI
-    if data == "poster:close":
-        try:
-            await q.message.delete()
-        except Exception:
-            pass
+    # Double-clicks under lag: later presses wait for the first pipeline instead of repeating it
+    key = (q.from_user.id if q.from_user else 0, data)
+    pending = _INFLIGHT.get(key)
+    if pending is not None:
+        await pending
         return
+    fut = asyncio.get_running_loop().create_future()
+    _INFLIGHT[key] = fut
+    try:
+        await _dispatch_poster_cb(q, context, data)
+    finally:
+        del _INFLIGHT[key]
+        fut.set_result(None)
+
+def _decode_kind(ctype: str, imgtype: str) -> Optional[Tuple[str, str]]:
+    """Map 1-char (or legacy full-word) ctype/imgtype back to names; None if unknown."""
+    ctype = _CTYPE_NAME.get(ctype, ctype)
+    imgtype = _IMGTYPE_NAME.get(imgtype, imgtype)
+    if ctype not in _CTYPE_CODE or imgtype not in _IMGTYPE_CODE:
+        return None
+    return ctype, imgtype
+
+async def _load_pages(context: ContextTypes.DEFAULT_TYPE, ctype: str, tmdb_id: str,
+                      imgtype: str, langkey: str) -> Optional[tuple]:
+    """(items, caption head) for one language selection: per-user state first, TMDB when cold."""
+    state = _recall_pages(context, (tmdb_id, imgtype, langkey))
+    if state:
+        return state
+    # The type step just cached the all-language listing, already indexed by language:
+    # a plain dict lookup then, and the filtered TMDB fetch only when that has expired
+    images = tmdb_async.peek(("images", ctype, tmdb_id, None))
+    if images is not None:
+        _, title, year = await _title_info(context, tmdb_id)
+    else:
+        (_, title, year), images = await asyncio.gather(
+            _title_info(context, tmdb_id),
+            _tmdb_images(tmdb_id, ctype, lang=langkey),
+        )
+    kind = "backdrops" if imgtype == "backdrop" else "posters"
+    items = images["by_lang_" + kind].get(langkey, [])
+    if not items:
+        return None
+    state = (items, _caption_head(title, year, imgtype, langkey))
+    _remember_pages(context, (tmdb_id, imgtype, langkey), state)
+    return state
+
+def _page(items: List[dict], head: str, index: int, ctype: str, tmdb_id: str,
+          imgtype: str, langkey: str) -> Optional[Tuple[str, str, InlineKeyboardMarkup]]:
+    """(url, caption, keyboard) for page `index`, or None if the image has no path."""
+    chosen = items[index]
+    file_path = chosen.get("file_path")
+    if not file_path:
+        return None
+    url = f"{TMDB_IMG}{file_path}"
+    width = chosen.get("width") or "Unknown"
+    height = chosen.get("height") or "Unknown"
+    caption = _build_caption(head, width, height, url)
+    kb = _paging_keyboard(len(items), index, ctype, tmdb_id, imgtype, langkey)
+    return url, caption, kb
+
+# Close the UI
+# p:x
+async def _on_close(q, context: ContextTypes.DEFAULT_TYPE, args: List[str]):
+    try:
+        await q.message.delete()
+    except TelegramError:
+        pass
 
-    # Step 1: user selected a movie — choose type
-    if data.startswith("poster:select:"):
-        tmdb_id = data.split(":", 2)[2]
-        ctype, title, year = _tmdb_details(tmdb_id)
-        caption = f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n<b>Choose image type:</b>"
-        kb = InlineKeyboardMarkup([
-            [
-                InlineKeyboardButton("Landscape", callback_data=f"poster:type:{ctype}:{tmdb_id}:backdrop"),
-                InlineKeyboardButton("Portrait", callback_data=f"poster:type:{ctype}:{tmdb_id}:poster"),
-            ],
-            [InlineKeyboardButton("❌ Close", callback_data="poster:close")],
-        ])
-        try:
-            await q.message.edit_text(caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-        except Exception:
-            try:
-                await q.message.reply_text(caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-            except Exception:
-                pass
+# Step 1: user selected a movie — choose type
+# p:s:<id>
+async def _on_select(q, context: ContextTypes.DEFAULT_TYPE, args: List[str]):
+    tmdb_id = args[0]
+    if not tmdb_id.isdigit():
+        return
+    ctype, title, year = await _title_info(context, tmdb_id)
+    caption = f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n<b>Choose image type:</b>"
+    kb = _type_menu_kb(ctype, tmdb_id)
+    await _edit_or_reply(q.message, caption, parse_mode=ParseMode.HTML, reply_markup=kb)
+
+# Step 2: user chose type — list languages (fixed + TMDB-present)
+# p:t:<ctype>:<id>:<imgtype|menu>
+async def _on_type(q, context: ContextTypes.DEFAULT_TYPE, args: List[str]):
+    kinds = _decode_kind(args[0], args[2])
+    tmdb_id = args[1]
+    if not kinds or not tmdb_id.isdigit():
         return
+    ctype, imgtype = kinds
 
-    # Step 2: user chose type — list languages (fixed + TMDB-present)
-    # poster:type:<ctype>:<id>:backdrop|poster|menu
-    if data.startswith("poster:type:"):
-        parts = data.split(":")
-        if len(parts) < 5:
-            return
-        ctype = parts[2]
-        tmdb_id = parts[3]
-        imgtype = parts[4]
-
-        if imgtype == "menu":
-            _, title, year = _tmdb_details(tmdb_id)
-            kb = InlineKeyboardMarkup([
-                [
-                    InlineKeyboardButton("Landscape", callback_data=f"poster:type:{ctype}:{tmdb_id}:backdrop"),
-                    InlineKeyboardButton("Portrait", callback_data=f"poster:type:{ctype}:{tmdb_id}:poster"),
-                ],
-                [InlineKeyboardButton("❌ Close", callback_data="poster:close")],
-            ])
-            try:
-                await q.message.edit_text(f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n<b>Choose image type:</b>",
-                                          parse_mode=ParseMode.HTML, reply_markup=kb)
-            except Exception:
-                pass
-            return
+    if imgtype == "menu":
+        _, title, year = await _title_info(context, tmdb_id)
+        kb = _type_menu_kb(ctype, tmdb_id)
+        await _edit_or_reply(q.message, f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n<b>Choose image type:</b>",
+                             parse_mode=ParseMode.HTML, reply_markup=kb)
+        return
 
-        images = _tmdb_images(tmdb_id, ctype)
-        items = images.get("backdrops" if imgtype == "backdrop" else "posters") or []
-
-        if not items:
-            try:
-                await q.message.edit_text("❌ No images found for this type.", reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("⬅ Back", callback_data=f"poster:type:{ctype}:{tmdb_id}:menu")],
-                    [InlineKeyboardButton("❌ Close", callback_data="poster:close")],
-                ]))
-            except Exception:
-                pass
-            return
+    (_, title, year), images = await asyncio.gather(
+        _title_info(context, tmdb_id),
+        _tmdb_images(tmdb_id, ctype),
+    )
+    kind = "backdrops" if imgtype == "backdrop" else "posters"
+    items = images.get(kind) or []
 
-        _, title, year = _tmdb_details(tmdb_id)
-        header = f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n<b>Choose a language:</b>"
-        kb = _build_language_keyboard(items, ctype, tmdb_id, imgtype)
-        try:
-            await q.message.edit_text(header, parse_mode=ParseMode.HTML, reply_markup=kb)
-        except Exception:
-            pass
+    if not items:
+        await _edit_or_reply(q.message, "❌ No images found for this type.", reply_markup=_back_close_kb(ctype, tmdb_id))
         return
 
-    # Step 3: user selected a language — show first image with paging keyboard + number buttons
-    # poster:lang:<ctype>:<id>:<imgtype>:<langcode or 'none'>
-    if data.startswith("poster:lang:"):
-        parts = data.split(":")
-        if len(parts) < 6:
-            return
-        ctype = parts[2]
-        tmdb_id = parts[3]
-        imgtype = parts[4]
-        langkey = parts[5]
-
-        ctype_, title, year = _tmdb_details(tmdb_id)
-        images = _tmdb_images(tmdb_id, ctype)
-        all_items = images.get("backdrops" if imgtype == "backdrop" else "posters") or []
-        items = _filter_items_by_lang(all_items, langkey)
-
-        if not items:
-            try:
-                await q.message.edit_text("❌ No images for this language.", reply_markup=InlineKeyboardMarkup([
-                    [InlineKeyboardButton("⬅ Back", callback_data=f"poster:type:{ctype}:{tmdb_id}:menu")],
-                    [InlineKeyboardButton("❌ Close", callback_data="poster:close")],
-                ]))
-            except Exception:
-                pass
-            return
+    header = f"<b>{html.escape(title)} ({html.escape(year)})</b>\n\n<b>Choose a language:</b>"
+    by_lang = images["by_lang_" + kind]
+    kb = _build_language_keyboard(by_lang, ctype, tmdb_id, imgtype)
+    await _edit_or_reply(q.message, header, parse_mode=ParseMode.HTML, reply_markup=kb)
+
+# Step 3: user selected a language — show first image with paging keyboard + number buttons
+# p:l:<ctype>:<id>:<imgtype>:<langcode or 'none'>
+async def _on_lang(q, context: ContextTypes.DEFAULT_TYPE, args: List[str]):
+    kinds = _decode_kind(args[0], args[2])
+    tmdb_id, langkey = args[1], args[3]
+    if not kinds or not tmdb_id.isdigit():
+        return
+    ctype, imgtype = kinds
+
+    # Instant feedback while TMDB and the photo send run: the buttons vanish at once
+    # (which also stops repeat taps); the message itself is replaced below
+    strip = context.application.create_task(_strip_keyboard(q.message))
+
+    # Re-picking a language (Back, then the same button) reuses the page state
+    state = await _load_pages(context, ctype, tmdb_id, imgtype, langkey)
+    if not state:
+        # Let the strip land first, or it could remove the Back/Close buttons set here
+        await strip
+        await _edit_or_reply(q.message, "❌ No images for this language.", reply_markup=_back_close_kb(ctype, tmdb_id))
+        return
+    items, head = state
 
-        index = 0
-        chosen = items[index]
-        file_path = chosen.get("file_path")
-        if not file_path:
-            return
+    page = _page(items, head, 0, ctype, tmdb_id, imgtype, langkey)
+    if not page:
+        return
+    url, caption, kb = page
 
-        url = f"{TMDB_IMG}{file_path}"
-        width = chosen.get("width") or "Unknown"
-        height = chosen.get("height") or "Unknown"
-        lang_name = _lang_label(langkey)
-        caption = _build_caption(title, year, imgtype, lang_name, width, height, url)
-        kb = _paging_keyboard(len(items), index, ctype, tmdb_id, imgtype, langkey)
+    # Send a new photo with caption + keyboard, delete selection message
+    try:
+        await _send_poster(q.message.chat, url, caption, kb)
+    except TelegramError:
+        await q.message.chat.send_message(text=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
+    try:
+        await q.message.delete()
+    except TelegramError:
+        pass
 
-        # Send a new photo with caption + keyboard, delete selection message
-        try:
-            img = download_bytes(url)
-            if img:
-                bio = BytesIO(img); bio.name = "poster.jpg"
-                await q.message.chat.send_photo(photo=bio, caption=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-            else:
-                await q.message.chat.send_message(text=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-            try:
-                await q.message.delete()
-            except Exception:
-                pass
-        except Exception:
-            await q.message.chat.send_message(text=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-            try:
-                await q.message.delete()
-            except Exception:
-                pass
+# Step 4: paging — number or arrow buttons
+# p:v:<ctype>:<id>:<imgtype>:<langkey>:<index>
+async def _on_view(q, context: ContextTypes.DEFAULT_TYPE, args: List[str]):
+    kinds = _decode_kind(args[0], args[2])
+    tmdb_id, langkey, index = args[1], args[3], args[4]
+    if not kinds or not tmdb_id.isdigit() or not index.isdigit():
         return
+    ctype, imgtype = kinds
 
-    # Step 4: paging — number or arrow buttons
-    # poster:view:<ctype>:<id>:<imgtype>:<langkey>:<index>
-    if data.startswith("poster:view:"):
-        parts = data.split(":")
-        if len(parts) < 7:
-            return
-        ctype = parts[2]
-        tmdb_id = parts[3]
-        imgtype = parts[4]
-        langkey = parts[5]
-        try:
-            index = int(parts[6])
-        except Exception:
-            index = 0
-
-        ctype_, title, year = _tmdb_details(tmdb_id)
-        images = _tmdb_images(tmdb_id, ctype)
-        all_items = images.get("backdrops" if imgtype == "backdrop" else "posters") or []
-        items = _filter_items_by_lang(all_items, langkey)
-        if not items:
-            return
-
-        index = max(0, min(len(items) - 1, index))
-        chosen = items[index]
-        file_path = chosen.get("file_path")
-        if not file_path:
-            return
+    # Page state from the language step; refetch only when cold (e.g. after a restart)
+    state = await _load_pages(context, ctype, tmdb_id, imgtype, langkey)
+    if not state:
+        return
+    items, head = state
 
-        url = f"{TMDB_IMG}{file_path}"
-        width = chosen.get("width") or "Unknown"
-        height = chosen.get("height") or "Unknown"
-        lang_name = _lang_label(langkey)
-        caption = _build_caption(title, year, imgtype, lang_name, width, height, url)
-        kb = _paging_keyboard(len(items), index, ctype, tmdb_id, imgtype, langkey)
+    index = max(0, min(len(items) - 1, int(index)))
+    page = _page(items, head, index, ctype, tmdb_id, imgtype, langkey)
+    if not page:
+        return
+    url, caption, kb = page
 
-        # Try to edit media; if fails (message not a photo), send new and delete old
+    # Try to edit media; if fails (message not a photo), send new and delete old
+    try:
+        edited = await q.message.edit_media(
+            media=InputMediaPhoto(media=_FILE_IDS.get(url, url), caption=caption, parse_mode=ParseMode.HTML),
+            reply_markup=kb
+        )
+        _remember_file_id(url, edited)
+    except BadRequest as e:
+        if "not modified" in str(e).lower():
+            return
         try:
-            await q.message.edit_media(
-                media=InputMediaPhoto(media=url, caption=caption, parse_mode=ParseMode.HTML),
-                reply_markup=kb
-            )
-        except Exception:
-            try:
-                img = download_bytes(url)
-                if img:
-                    bio = BytesIO(img); bio.name = "poster.jpg"
-                    await q.message.chat.send_photo(photo=bio, caption=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-                else:
-                    await q.message.chat.send_message(text=caption, parse_mode=ParseMode.HTML, reply_markup=kb)
-                await q.message.delete()
-            except Exception:
-                pass
+            await _send_poster(q.message.chat, url, caption, kb)
+            await q.message.delete()
+        except TelegramError:
+            pass
+    except TelegramError:
+        # Timeouts and the like: the edit may well have landed, so don't double-send
+        pass
+
+# step -> (handler, number of ":"-separated args); legacy full-word steps map to the same handlers
+_CB_HANDLERS = {
+    "x": (_on_close, 0), "close": (_on_close, 0),
+    "s": (_on_select, 1), "select": (_on_select, 1),
+    "t": (_on_type, 3), "type": (_on_type, 3),
+    "l": (_on_lang, 4), "lang": (_on_lang, 4),
+    "v": (_on_view, 5), "view": (_on_view, 5),
+}
+
+async def _dispatch_poster_cb(q, context: ContextTypes.DEFAULT_TYPE, data: str):
+    _, _, rest = data.partition(":")
+    step, _, rest = rest.partition(":")
+    entry = _CB_HANDLERS.get(step)
+    if entry is None:
+        return
+    handler, arity = entry
+    args = rest.split(":") if rest else []
+    if len(args) != arity or not all(args):
         return
+    await handler(q, context, args)
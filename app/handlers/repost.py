@@ -1,21 +1,38 @@
-import html
+import asyncio
+import importlib.util
+import io
 import logging
 import re
+import time
 import urllib.parse
-from io import BytesIO
-from typing import Optional, Tuple, Dict, Any, List
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Optional, Tuple, Dict, Any, Iterator, List
 
 import aiohttp
-from bs4 import BeautifulSoup
-from telegram import Update
+import orjson
+from telegram import InputFile, Update
 from telegram.constants import ParseMode
+from telegram.error import BadRequest, TelegramError
 from telegram.ext import ContextTypes
 
+__all__ = ["rk", "rk_cmd", "open_session", "close_session"]
+
 logger = logging.getLogger(__name__)
 
 TMDB_IMG_ORIGIN = "https://image.tmdb.org"
 DIRECT_IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".webp", ".avif")
 
+# Compiled once; these run on every /rk
+# Anchor href (group 1) or bare URL (group 2), in one scan
+_URL_ANY_RE = re.compile(r"""<a\s+href=['"]([^'"]+)['"]|(https?://[^\s<>'"]+)""", re.IGNORECASE)
+_TMDB_SIZE_PATH_RE = re.compile(r"^/w\d+/")
+_SCHEMELESS_HOST_RE = re.compile(r"^(?:[\w-]+\.)+[a-z]{2,}/", re.IGNORECASE)
+# /rk argument that looks like a link or TMDB path (scheme optional); anything else is caption noise
+_TARGET_RE = re.compile(r"^(?:https?://|/|(?:[\w-]+\.)+[a-z]{2,}(?:[/:?#]|$))", re.IGNORECASE)
+_TMDB_PATH_PREFIXES = ("/t/", "/p/", "/original")
+_AUDIO_HEADING_RE = re.compile(r'(?im)^\s*(?:<b>)?[^<]*audio\s*tracks\s*:\s*(?:</b>)?.*$')
+
 # ---------- Caption helpers assumed in your project ----------
 try:
     from app.handlers.core import track_user
@@ -26,9 +43,12 @@ except Exception:
 try:
     from app.handlers.utils import make_full_bold
 except Exception:
+    # Same output as html.escape(quote=True), but one C-level pass over the whole caption
+    _HTML_ESCAPE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
     def make_full_bold(text: str) -> str:
-        lines = [(f"<b>{html.escape(l)}</b>" if l.strip() else l) for l in (text or "").splitlines()]
-        return "\n".join(lines)
+        esc = (text or "").translate(_HTML_ESCAPE)
+        return "\n".join(f"<b>{l}</b>" if l.strip() else l for l in esc.splitlines())
 
 try:
     from app.handlers.ucer import transform_audio_block as _transform_audio_block_to_ucer
@@ -37,32 +57,97 @@ except Exception:
         return text
 
 # ---------- Async HTTP session management ----------
-def _ensure_session(context: ContextTypes.DEFAULT_TYPE) -> aiohttp.ClientSession:
-    session: Optional[aiohttp.ClientSession] = context.bot_data.get("_aiohttp_session")
-    if session and not session.closed:
-        return session
-    timeout = aiohttp.ClientTimeout(total=14)
-    connector = aiohttp.TCPConnector(limit=50, enable_cleanup_closed=True)
-    session = aiohttp.ClientSession(timeout=timeout, connector=connector, headers={"User-Agent": "Mozilla/5.0"})
-    context.bot_data["_aiohttp_session"] = session
-    return session
+# aiohttp decompresses gzip/deflate bodies itself (auto_decompress defaults to True)
+_DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0", "Accept-Encoding": "gzip, deflate"}
+_JSON_HEADERS = {"Accept": "application/json"}
+_IMAGE_HEADERS = {"Accept": "image/*"}
+
+# c-ares lookups on the loop (aiodns) instead of getaddrinfo in the thread pool
+_HAS_AIODNS = importlib.util.find_spec("aiodns") is not None
 
-async def _download_bytes(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+def _new_session() -> aiohttp.ClientSession:
+    timeout = aiohttp.ClientTimeout(total=14)
+    # Per-host cap so a burst to one worker can't starve the rest; DNS cached for 5 min
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=10,
+        ttl_dns_cache=300,
+        resolver=aiohttp.AsyncResolver() if _HAS_AIODNS else None,
+        keepalive_timeout=60,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(timeout=timeout, connector=connector, headers=_DEFAULT_HEADERS)
+
+# One session per process: pooled keep-alive connections to image.tmdb.org and the
+# worker domains are shared by every handler call
+_SESSION: Optional[aiohttp.ClientSession] = None
+
+def _get_session() -> aiohttp.ClientSession:
+    """Process-wide session, created lazily inside the running loop."""
+    global _SESSION
+    if _SESSION is None or _SESSION.closed:
+        _SESSION = _new_session()
+    return _SESSION
+
+async def open_session(application) -> None:
+    """post_init hook: create the session up front so the first /rk doesn't pay for it."""
+    _get_session()
+
+async def close_session(application) -> None:
+    """post_shutdown hook: close the session and its pooled connections."""
+    global _SESSION
+    if _SESSION is not None and not _SESSION.closed:
+        await _SESSION.close()
+    _SESSION = None
+
+# image URL -> expires_at for URLs that answered 4xx; not retried until then
+_FAILED_DOWNLOADS: "OrderedDict[str, float]" = OrderedDict()
+_FAILED_DOWNLOADS_MAX = 256
+_FAILED_DOWNLOAD_TTL = 300
+# Telegram rejects photo uploads above 10 MB, so larger bodies aren't worth buffering
+_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+async def _download_file(session: aiohttp.ClientSession, url: str) -> Optional[io.BytesIO]:
+    """
+    Download `url` in chunks into one in-memory buffer, rewound and ready to upload.
+    None on failure, including bodies over Telegram's photo upload limit.
+    """
+    until = _FAILED_DOWNLOADS.get(url)
+    if until is not None:
+        if time.monotonic() < until:
+            return None
+        del _FAILED_DOWNLOADS[url]
+    buf = io.BytesIO()
     try:
-        async with session.get(url) as r:
+        async with session.get(url, headers=_IMAGE_HEADERS) as r:
             if r.status != 200:
+                # Only definite client errors are remembered; 5xx/timeouts may pass
+                if 400 <= r.status < 500:
+                    _FAILED_DOWNLOADS[url] = time.monotonic() + _FAILED_DOWNLOAD_TTL
+                    while len(_FAILED_DOWNLOADS) > _FAILED_DOWNLOADS_MAX:
+                        _FAILED_DOWNLOADS.popitem(last=False)
                 return None
-            return await r.read()
+            async for chunk in r.content.iter_chunked(64 * 1024):
+                buf.write(chunk)
+                if buf.tell() > _MAX_UPLOAD_BYTES:
+                    logger.warning(f"_download_file: {url} exceeds {_MAX_UPLOAD_BYTES} bytes")
+                    return None
     except Exception as e:
-        logger.warning(f"_download_bytes failed for {url}: {e}")
+        logger.warning(f"_download_file failed for {url}: {e}")
         return None
+    buf.seek(0)
+    return buf
 
 async def _fetch_json(session: aiohttp.ClientSession, url: str) -> Optional[dict | list]:
     try:
-        async with session.get(url) as r:
+        async with session.get(url, headers=_JSON_HEADERS) as r:
             if r.status != 200:
                 return None
-            return await r.json(content_type=None)
+            # Parse the UTF-8 body directly; skips aiohttp's bytes -> str -> json.loads
+            return orjson.loads(await r.read())
+    except orjson.JSONDecodeError as e:
+        logger.warning(f"_fetch_json got invalid JSON from {url}: {e}")
+        return None
     except Exception as e:
         logger.warning(f"_fetch_json failed for {url}: {e}")
         return None
@@ -78,24 +163,27 @@ async def _fetch_text(session: aiohttp.ClientSession, url: str) -> Optional[str]
         return None
 
 # ---------- URL helpers ----------
-def _image_ext_from_url(url: str) -> str:
-    # Handle querystrings like ".jpg?x=y"
-    path = urllib.parse.urlparse(url).path or url
-    ext = path.lower().rsplit(".", 1)
-    return f".{ext[-1]}" if len(ext) > 1 else ""
-
 def _is_direct_image_link(url: str) -> bool:
-    return _image_ext_from_url(url) in DIRECT_IMAGE_EXTS
-
-def _extract_urls(text: str | None) -> list[str]:
+    # Handle querystrings like ".jpg?x=y" by cutting at the first "?"/"#"; no urlparse
+    if not url:
+        return False
+    for sep in ("?", "#"):
+        cut = url.find(sep)
+        if cut != -1:
+            url = url[:cut]
+    return url.lower().endswith(DIRECT_IMAGE_EXTS)
+
+def _extract_urls(text: str | None, limit: int = 8) -> list[str]:
+    """Anchor hrefs and bare URLs in document order, deduped, at most `limit`."""
     if not text:
         return []
-    urls = re.findall(r"""<a\s+href=['"]([^'"]+)['"]""", text, flags=re.IGNORECASE)
-    urls += re.findall(r"""https?://[^\s<>'"]+""", text)
     seen, out = set(), []
-    for u in urls:
+    for m in _URL_ANY_RE.finditer(text):
+        u = m.group(1) or m.group(2)
         if u not in seen:
             out.append(u); seen.add(u)
+            if len(out) >= limit:
+                break
     return out
 
 def _to_absolute_image_url(candidate: str, base: Optional[str] = None) -> str:
@@ -104,6 +192,8 @@ def _to_absolute_image_url(candidate: str, base: Optional[str] = None) -> str:
     - //image.tmdb.org/... → https:...
     - /t/p/original/... or /w780/... → https://image.tmdb.org + path
     - relative starting '/' with page base → urljoin(base, candidate)
+    - host/path without a scheme → https://host/path
+    - bare file name without page base (TMDB file_path minus '/') → treated as '/name'
     - already absolute → return as is
     """
     if not candidate:
@@ -114,7 +204,7 @@ def _to_absolute_image_url(candidate: str, base: Optional[str] = None) -> str:
         return "https:" + c
 
     # TMDB path variants
-    if c.startswith("/t/") or c.startswith("/p/") or c.startswith("/original") or re.match(r"^/w\d+/", c):
+    if c.startswith(_TMDB_PATH_PREFIXES) or _TMDB_SIZE_PATH_RE.match(c):
         return urllib.parse.urljoin(TMDB_IMG_ORIGIN, c)
 
     if c.startswith("/"):
@@ -123,6 +213,11 @@ def _to_absolute_image_url(candidate: str, base: Optional[str] = None) -> str:
         # fallback assume tmdb
         return urllib.parse.urljoin(TMDB_IMG_ORIGIN, c)
 
+    if _SCHEMELESS_HOST_RE.match(c):
+        return "https://" + c
+    if "/" not in c and not base:
+        return urllib.parse.urljoin(TMDB_IMG_ORIGIN, "/" + c)
+
     return c
 
 # ---------- Streaming resolution ----------
@@ -146,107 +241,223 @@ STREAM_API_MAP_TEMPLATES = {
     "hulu":             "https://hulu.ottposters.workers.dev/?url={encoded}",
 }
 
-def _pick_stream_api(target_url: str) -> Optional[str]:
-    enc = urllib.parse.quote_plus(target_url)
-    t = target_url.lower()
-    for key, tpl in STREAM_API_MAP_TEMPLATES.items():
-        if key in t:
-            return tpl.format(encoded=enc)
+# Keys with a dot are hostnames: matched against the URL's host and its parent
+# domains by dict lookup, so "www.hbomax.com" -> "hbomax.com" and "play.max.com" ->
+# "max.com", and a platform name that only appears in a path is never a hit.
+# The few bare brand keys ("sonyliv", "hulu", ...) are substring-checked on the host.
+_STREAM_HOSTS = {k: tpl for k, tpl in STREAM_API_MAP_TEMPLATES.items() if "." in k}
+_STREAM_HOST_WORDS = tuple((k, tpl) for k, tpl in STREAM_API_MAP_TEMPLATES.items() if "." not in k)
+
+def _stream_template(host: str) -> Optional[str]:
+    h = host
+    while h:
+        tpl = _STREAM_HOSTS.get(h)
+        if tpl:
+            return tpl
+        h = h.partition(".")[2]
+    for word, tpl in _STREAM_HOST_WORDS:
+        if word in host:
+            return tpl
     return None
 
-def _parse_landscape_from_json(data: dict | list) -> Optional[str]:
-    if not isinstance(data, (dict, list)):
+# Pure function of the URL over a constant map, so whole results are memoised
+@lru_cache(maxsize=4096)
+def _pick_stream_api(target_url: str) -> Optional[str]:
+    # Links pasted without a scheme ("www.netflix.com/title/…") have no netloc otherwise
+    parse_url = target_url if "://" in target_url else "https://" + target_url
+    try:
+        host = urllib.parse.urlsplit(parse_url).hostname  # lower-cased, no port/userinfo
+    except ValueError:  # e.g. an unbalanced "[" in the netloc
         return None
+    tpl = _stream_template(host) if host else None
+    if not tpl:
+        return None
+    # Always quoted: the target travels as the ?url= value, so its own ':', '/', '&', '='
+    # must not leak into the worker's query string even when they are "URL-safe"
+    return tpl.format(encoded=urllib.parse.quote_plus(target_url))
 
-    keys_primary = ("landscape", "backdrop", "horizontal", "image", "url", "poster_landscape", "backdrop_path")
-    keys_arrays = ("images", "backdrops", "results", "data")
+_LANDSCAPE_KEYS = ("landscape", "backdrop", "horizontal", "image", "url", "poster_landscape", "backdrop_path")
+_LANDSCAPE_ARRAY_KEYS = ("images", "backdrops", "results", "data")
 
-    def pick_from_obj(obj: dict) -> Optional[str]:
-        for k in keys_primary:
+def _iter_landscape_candidates(data: dict | list) -> Iterator[Tuple[str, bool]]:
+    """
+    Yield (candidate, relative_ok) in priority order: the object's own image keys,
+    then its file_path, then the items of its known arrays (one level deep).
+    `relative_ok` marks spots where a bare '/path' (TMDB etc.) is accepted.
+    """
+    def from_obj(obj: dict) -> Iterator[Tuple[str, bool]]:
+        for k in _LANDSCAPE_KEYS:
             v = obj.get(k)
-            if isinstance(v, str) and _is_direct_image_link(v):
-                return v
-            if isinstance(v, str) and v.startswith("/"):  # relative (TMDB etc.)
-                if _is_direct_image_link(v):
-                    return v
-        # Common nested formats
+            if isinstance(v, str):
+                yield v, False
         v = obj.get("file_path")
-        if isinstance(v, str) and (v.startswith("/") or _is_direct_image_link(v)):
-            return v
-        return None
+        if isinstance(v, str):
+            yield v, True
+
+    def from_list(arr: list) -> Iterator[Tuple[str, bool]]:
+        for it in arr:
+            if isinstance(it, str):
+                yield it, True
+            elif isinstance(it, dict):
+                yield from from_obj(it)
 
     if isinstance(data, dict):
-        got = pick_from_obj(data)
-        if got:
-            return got
-        for k in keys_arrays:
+        yield from from_obj(data)
+        for k in _LANDSCAPE_ARRAY_KEYS:
             arr = data.get(k)
             if isinstance(arr, list):
-                for it in arr:
-                    if isinstance(it, str) and (_is_direct_image_link(it) or it.startswith("/")):
-                        return it
-                    if isinstance(it, dict):
-                        g = pick_from_obj(it)
-                        if g:
-                            return g
-    else:  # list
-        for it in data:
-            if isinstance(it, str) and (_is_direct_image_link(it) or it.startswith("/")):
-                return it
-            if isinstance(it, dict):
-                g = pick_from_obj(it)
-                if g:
-                    return g
-    return None
+                yield from from_list(arr)
+    elif isinstance(data, list):
+        yield from from_list(data)
+
+def _parse_landscape_from_json(data: dict | list) -> Optional[str]:
+    # Lazy walk: stops at the first usable link without visiting the rest of the payload.
+    # Text with spaces (titles, descriptions) fails the allocation-free check first, so
+    # only link-like values pay for the lowercase + extension test. Scheme-less links
+    # and bare file names are kept; _to_absolute_image_url makes them absolute.
+    isimg = _is_direct_image_link
+    return next(
+        (v for v, relative_ok in _iter_landscape_candidates(data)
+         if " " not in v and ((relative_ok and v.startswith("/")) or isimg(v))),
+        None,
+    )
+
+_OG_IMAGE_KEYS = ("og:image", "twitter:image", "og:image:url")
+_OG_TITLE_KEYS = ("og:title", "twitter:title")
+
+# selectolax (C DOM + CSS selectors) when installed; otherwise BeautifulSoup, on the
+# C-backed lxml parser if available. find_spec keeps the imports themselves lazy.
+_HAS_SELECTOLAX = importlib.util.find_spec("selectolax") is not None
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+
+def _og_meta_selectolax(html_text: str) -> Tuple[Optional[str], Optional[str]]:
+    from selectolax.parser import HTMLParser
+    tree = HTMLParser(html_text)
+
+    def first(keys) -> Optional[str]:
+        for key in keys:
+            node = tree.css_first(f'meta[property="{key}"], meta[name="{key}"]')
+            content = node.attributes.get("content") if node else None
+            if content and content.strip():
+                return content.strip()
+        return None
+
+    title = first(_OG_TITLE_KEYS)
+    if not title:
+        node = tree.css_first("title")
+        title = (node.text() if node else "").strip() or None
+    return first(_OG_IMAGE_KEYS), title
+
+def _og_meta_soup(html_text: str) -> Tuple[Optional[str], Optional[str]]:
+    from bs4 import BeautifulSoup, SoupStrainer
+    # Only <meta> and <title> are read, so the tree is built for those alone
+    soup = BeautifulSoup(html_text, _HTML_PARSER, parse_only=SoupStrainer(["meta", "title"]))
+
+    def first(keys) -> Optional[str]:
+        for key in keys:
+            tag = soup.find("meta", attrs={"property": key}) or soup.find("meta", attrs={"name": key})
+            content = tag.get("content") if tag else None
+            if content and content.strip():
+                return content.strip()
+        return None
+
+    title = first(_OG_TITLE_KEYS)
+    if not title and soup.title and soup.title.text:
+        title = soup.title.text.strip()
+    return first(_OG_IMAGE_KEYS), title
+
+def _parse_og_meta(html_text: str, page_url: str) -> Tuple[Optional[str], Optional[str]]:
+    # HTML parsing is only needed for this OG fallback; URL extraction elsewhere
+    # stays on the compiled regexes above.
+    if _HAS_SELECTOLAX:
+        image, title = _og_meta_selectolax(html_text)
+    else:
+        image, title = _og_meta_soup(html_text)
+    if image:
+        image = _to_absolute_image_url(image, base=page_url)
+    return image, title
 
 async def _resolve_og_image(session: aiohttp.ClientSession, page_url: str) -> Tuple[Optional[str], Optional[str]]:
     html_text = await _fetch_text(session, page_url)
     if not html_text:
         return None, None
-    soup = BeautifulSoup(html_text, "html.parser")
-    image = None
-    for key in ("og:image", "twitter:image", "og:image:url"):
-        tag = soup.find("meta", attrs={"property": key}) or soup.find("meta", attrs={"name": key})
-        if tag and tag.get("content"):
-            image = tag["content"].strip()
-            break
-    if image:
-        image = _to_absolute_image_url(image, base=page_url)
-    title = None
-    for key in ("og:title", "twitter:title"):
-        tag = soup.find("meta", attrs={"property": key}) or soup.find("meta", attrs={"name": key})
-        if tag and tag.get("content"):
-            title = tag["content"].strip()
-            break
-    if not title and soup.title and soup.title.text:
-        title = soup.title.text.strip()
-    return image, title
+    # Landing pages run to hundreds of KB; parse in a worker thread so the loop keeps
+    # serving other updates meanwhile
+    return await asyncio.to_thread(_parse_og_meta, html_text, page_url)
+
+# target URL -> (expires_at, landscape URL or None); bounded LRU. None records a
+# lookup that found nothing, kept briefly so retries don't hit the worker API again.
+_LANDSCAPE_CACHE: "OrderedDict[str, Tuple[float, Optional[str]]]" = OrderedDict()
+_LANDSCAPE_CACHE_MAX = 2048
+_LANDSCAPE_TTL = 3600
+_LANDSCAPE_NEG_TTL = 300
+_MISS = object()
+
+def _landscape_cache_get(target_url: str):
+    """Cached landscape, None for a remembered failure, or _MISS."""
+    entry = _LANDSCAPE_CACHE.get(target_url)
+    if not entry:
+        return _MISS
+    if time.monotonic() >= entry[0]:
+        del _LANDSCAPE_CACHE[target_url]
+        return _MISS
+    _LANDSCAPE_CACHE.move_to_end(target_url)
+    return entry[1]
+
+def _expect_fast(targets: List[str]) -> bool:
+    """True when every target is a streaming link already in the landscape cache."""
+    return all(
+        not (_is_direct_image_link(t) or t.startswith("/")) and _landscape_cache_get(t) is not _MISS
+        for t in targets
+    )
+
+def _landscape_cache_put(target_url: str, landscape: Optional[str]) -> None:
+    ttl = _LANDSCAPE_TTL if landscape else _LANDSCAPE_NEG_TTL
+    _LANDSCAPE_CACHE[target_url] = (time.monotonic() + ttl, landscape)
+    _LANDSCAPE_CACHE.move_to_end(target_url)
+    while len(_LANDSCAPE_CACHE) > _LANDSCAPE_CACHE_MAX:
+        _LANDSCAPE_CACHE.popitem(last=False)
+
+# If the worker API hasn't answered by then, the OG page fetch starts alongside it
+# (hedged), so a failing API no longer costs API latency + page latency in series.
+# Fast APIs never trigger the extra page request.
+_OG_HEDGE_AFTER = 1.5
+
+async def _landscape_from_api(session: aiohttp.ClientSession, api_url: str) -> Optional[str]:
+    data = await _fetch_json(session, api_url)
+    candidate = _parse_landscape_from_json(data) if data else None
+    return _to_absolute_image_url(candidate) if candidate else None
+
+async def _landscape_from_og(session: aiohttp.ClientSession, target_url: str) -> Optional[str]:
+    og_img, _ = await _resolve_og_image(session, target_url)
+    return og_img or None
 
 async def _resolve_streaming_landscape(session: aiohttp.ClientSession, target_url: str) -> Optional[str]:
-    cache: dict = getattr(session, "_rk_cache", {})
-    cached = cache.get(target_url)
-    if cached:
+    cached = _landscape_cache_get(target_url)
+    if cached is not _MISS:
         return cached
 
     api_url = _pick_stream_api(target_url)
     landscape = None
-
-    if api_url:
-        data = await _fetch_json(session, api_url)
-        if data:
-            candidate = _parse_landscape_from_json(data)
-            if candidate:
-                landscape = _to_absolute_image_url(candidate)
-
-    # OG fallback if API didn’t return
-    if not landscape:
-        og_img, _ = await _resolve_og_image(session, target_url)
-        if og_img:
-            landscape = og_img
-
-    if landscape:
-        cache[target_url] = landscape
-        setattr(session, "_rk_cache", cache)
+    api_task = og_task = None
+    try:
+        if api_url:
+            api_task = asyncio.create_task(_landscape_from_api(session, api_url))
+            done, _ = await asyncio.wait({api_task}, timeout=_OG_HEDGE_AFTER)
+            if not done:
+                og_task = asyncio.create_task(_landscape_from_og(session, target_url))
+            # The API result still wins whenever it has one
+            landscape = await api_task
+
+        # OG fallback if API didn’t return
+        if not landscape:
+            landscape = await (og_task or _landscape_from_og(session, target_url))
+    finally:
+        for task in (api_task, og_task):
+            if task and not task.done():
+                task.cancel()
+
+    _landscape_cache_put(target_url, landscape)
     return landscape
 
 # ---------- Audio block styling ----------
@@ -265,11 +476,12 @@ def _wrap_audio_block_in_blockquote(html_caption: str) -> str:
     <b>DDP | 5.1 | 384 kb/s | Malayalam</b>
     <b>DDP | 5.1 | 640 kb/s | English</b></blockquote>
     """
-    if not html_caption:
+    # Literal prefilter: most captions have no audio section, so skip the regex scan
+    if not html_caption or "audio" not in html_caption.lower():
         return html_caption
 
     # Find the header line containing "Audio Tracks:"
-    m = re.search(r'(?im)^\s*(?:<b>)?[^<]*audio\s*tracks\s*:\s*(?:</b>)?.*$', html_caption)
+    m = _AUDIO_HEADING_RE.search(html_caption)
     if not m:
         return html_caption
 
@@ -293,37 +505,89 @@ def _wrap_audio_block_in_blockquote(html_caption: str) -> str:
     if not lines:
         return html_caption
 
-    # Header: strip existing <b>, enforce bold
-    header_txt = _strip_b_tags(lines[0])
-    header_line = f"<b>{header_txt}</b>"
-
-    # Track lines: strip existing <b>, re-bold WITHOUT indentation
-    track_lines = []
-    for ln in lines[1:]:
-        t = _strip_b_tags(ln)
-        if not t:
-            continue
-        track_lines.append(f"<b>{t}</b>")
-
-    # Build exact blockquote (no trailing newline before closing)
-    quoted = "<blockquote>" + header_line
-    if track_lines:
-        quoted += "\n" + "\n".join(track_lines)
-    quoted += "</blockquote>"
-
-    # Rebuild caption: prefix + quoted + optional rest
-    prefix = html_caption[:start_idx]
-    rebuilt = prefix + quoted
-    if rest.strip():
-        rebuilt += "\n\n" + rest
-    return rebuilt
+    # Header and track lines: strip existing <b>, re-bold WITHOUT indentation
+    bolded = [f"<b>{_strip_b_tags(lines[0])}</b>"]
+    bolded += [f"<b>{t}</b>" for t in map(_strip_b_tags, lines[1:]) if t]
+
+    # Exact blockquote (no trailing newline before closing), then prefix + quoted + optional rest
+    return "".join((
+        html_caption[:start_idx],
+        "<blockquote>", "\n".join(bolded), "</blockquote>",
+        "\n\n" + rest if rest.strip() else "",
+    ))
+
+# ---------- Caption rendering ----------
+# (chat_id, replied message_id, user_id, hash(raw caption)) -> (expires_at, rendered HTML),
+# so retrying /rk on the same post skips the bold/UCER/blockquote rewrite. User is part
+# of the key because the UCER audio transform is per-user; the TTL bounds how long a
+# changed UCER setting can go unnoticed.
+_CAPTION_CACHE: "OrderedDict[tuple, Tuple[float, str]]" = OrderedDict()
+_CAPTION_CACHE_MAX = 1024
+_CAPTION_TTL = 600
+
+def _render_caption(raw_caption: str, user_id: int, key: tuple) -> str:
+    hit = _CAPTION_CACHE.get(key)
+    if hit is not None:
+        if time.monotonic() < hit[0]:
+            _CAPTION_CACHE.move_to_end(key)
+            return hit[1]
+        del _CAPTION_CACHE[key]
+    caption = make_full_bold(raw_caption)
+    try:
+        caption = _transform_audio_block_to_ucer(caption, user_id)
+    except Exception as e:
+        logger.warning(f"/rk audio transform failed: {e}")
+    caption = _wrap_audio_block_in_blockquote(caption)
+    _CAPTION_CACHE[key] = (time.monotonic() + _CAPTION_TTL, caption)
+    while len(_CAPTION_CACHE) > _CAPTION_CACHE_MAX:
+        _CAPTION_CACHE.popitem(last=False)
+    return caption
 
 # ---------- Command ----------
+async def _resolve_target(session: aiohttp.ClientSession, target: str) -> Tuple[Optional[str], str, Optional[str], str]:
+    """
+    (absolute image URL, upload filename, error text, download-failure text) for one
+    /rk argument.
+    """
+    # Direct image link flow (supports TMDB relative path too)
+    if _is_direct_image_link(target) or target.startswith("/"):
+        return _to_absolute_image_url(target), "poster.jpg", None, "❌ Could not download the image."
+
+    # Streaming link flow
+    landscape = await _resolve_streaming_landscape(session, target)
+    if not landscape or not _is_direct_image_link(landscape):
+        return None, "", "❌ Landscape poster not found or unsupported platform.", ""
+    return landscape, "streaming_landscape.jpg", None, "❌ Poster download failed"
+
+async def _send_target(session: aiohttp.ClientSession, reply_photo, target: str, caption: str) -> Optional[str]:
+    """Resolve and send one /rk target; returns error text on failure."""
+    url, name, err, download_err = await _resolve_target(session, target)
+    if err:
+        return err
+    kw = {"caption": caption, "parse_mode": ParseMode.HTML} if caption else {}
+
+    # Let Telegram fetch the image itself: no download or upload through this host.
+    # Timeouts aren't retried by upload, since the photo may already have been posted.
+    try:
+        await reply_photo(photo=url, **kw)
+        return None
+    except BadRequest as e:
+        logger.info(f"/rk URL send rejected ({e}); uploading {url}")
+
+    img = await _download_file(session, url)
+    if img is None:
+        return download_err
+    # Handed over as a file so the upload streams from the buffer instead of copying it
+    await reply_photo(photo=InputFile(img, filename=name, read_file_handle=False), **kw)
+    return None
+
 async def rk(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
     /rk:
     - /rk <streaming link> → resolve LANDSCAPE image via worker API; fallback to OG image if needed.
-    - /rk <direct image link> → download and upload (supports TMDB paths and querystrings).
+    - /rk <direct image link> → send by URL, or download and upload if Telegram can't fetch it
+      (supports TMDB paths and querystrings).
+    - Several links at once are resolved concurrently; each photo is sent as soon as it is ready.
     - When replying to a /get post, reuse SAME caption (FULL BOLD + UCER), with Audio section as quoted bold block.
     """
     track_user(update.effective_user.id)
@@ -331,66 +595,59 @@ async def rk(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not msg:
         return
 
-    if not context.args:
+    targets = list(dict.fromkeys(a.strip() for a in context.args or () if _TARGET_RE.match(a.strip())))
+    if not targets:
         await msg.reply_text("❌ Usage:\n/rk <streaming link | direct image link>\n\nTip: Reply to your /get post to reuse the same caption.")
         return
-
-    target = context.args[0].strip()
     replied = msg.reply_to_message
 
     # Build caption from replied message (if present)
     raw_caption = (replied.caption or replied.text) if replied else None
     caption = ""
     if raw_caption:
-        caption = make_full_bold(raw_caption)
-        try:
-            caption = _transform_audio_block_to_ucer(caption, update.effective_user.id)
-        except Exception as e:
-            logger.warning(f"/rk audio transform failed: {e}")
-        caption = _wrap_audio_block_in_blockquote(caption)
+        key = (msg.chat_id, replied.message_id, update.effective_user.id, hash(raw_caption))
+        caption = _render_caption(raw_caption, update.effective_user.id, key)
 
-    session = _ensure_session(context)
+    session = _get_session()
+    reply_photo = replied.reply_photo if replied else msg.reply_photo
 
-    # Direct image link flow (supports TMDB relative path too)
-    if _is_direct_image_link(target) or target.startswith("/"):
-        abs_url = _to_absolute_image_url(target)
-        status = await msg.reply_text("⬇️ Downloading image...")
-        img_bytes = await _download_bytes(session, abs_url)
-        if not img_bytes:
-            await status.edit_text("❌ Could not download the image.")
-            return
-        bio = BytesIO(img_bytes); bio.name = "poster.jpg"
+    if len(targets) > 1:
+        status_text = f"🔍 Fetching {len(targets)} posters..."
+    elif _is_direct_image_link(targets[0]) or targets[0].startswith("/"):
+        status_text = "🖼 Sending image..."
+    else:
+        status_text = "🔍 Fetching streaming poster..."
+    # Cached landscapes go straight out with no status; otherwise the status is posted
+    # first so it can never land after (and flicker below) the poster
+    status = None
+    if not _expect_fast(targets):
+        try:
+            status = await msg.reply_text(status_text)
+        except TelegramError as e:
+            logger.warning(f"/rk status message failed: {e}")
+
+    # Lookups and sends for all links overlap; each photo goes out as soon as it is ready
+    results = await asyncio.gather(
+        *(_send_target(session, reply_photo, t, caption) for t in targets), return_exceptions=True
+    )
+    errors = []
+    for target, err in zip(targets, results):
+        if isinstance(err, BaseException):
+            logger.warning(f"/rk send failed for {target}: {err}")
+            err = f"❌ Failed to send: {err}"
+        if err:
+            errors.append(err if len(targets) == 1 else f"{err}\n{target}")
+    if errors:
+        if status:
+            await status.edit_text("\n\n".join(errors))
+        else:
+            await msg.reply_text("\n\n".join(errors))
+        return
+    if status:
         try:
             await status.delete()
         except Exception:
             pass
-        if caption:
-            await (replied.reply_photo if replied else msg.reply_photo)(photo=bio, caption=caption, parse_mode=ParseMode.HTML)
-        else:
-            await (replied.reply_photo if replied else msg.reply_photo)(photo=bio)
-        return
-
-    # Streaming link flow
-    status = await msg.reply_text("🔍 Fetching streaming poster...")
-    landscape = await _resolve_streaming_landscape(session, target)
-    if not landscape or not _is_direct_image_link(landscape):
-        await status.edit_text("❌ Landscape poster not found or unsupported platform.")
-        return
-
-    img_bytes = await _download_bytes(session, landscape)
-    if not img_bytes:
-        await status.edit_text("❌ Poster download failed")
-        return
-
-    bio = BytesIO(img_bytes); bio.name = "streaming_landscape.jpg"
-    try:
-        await status.delete()
-    except Exception:
-        pass
-    if caption:
-        await (replied.reply_photo if replied else msg.reply_photo)(photo=bio, caption=caption, parse_mode=ParseMode.HTML)
-    else:
-        await (replied.reply_photo if replied else msg.reply_photo)(photo=bio)
 
 # Backwards-compat alias
 async def rk_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
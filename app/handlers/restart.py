@@ -1,5 +1,6 @@
+import asyncio
 import os
-from threading import Timer
+import threading
 from datetime import datetime
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
@@ -7,20 +8,23 @@ from telegram.ext import ContextTypes
 from app.config import OWNER_ID
 
 def _is_owner(user_id: int | None) -> bool:
-    return bool(user_id) and int(user_id) == int(OWNER_ID or 0)
+    # OWNER_ID is already parsed to int in app.config
+    return bool(user_id) and user_id == OWNER_ID
+
+# Seconds to wait for a graceful stop before forcing the exit
+_HARD_EXIT_AFTER = 15.0
+
+# Whole block in one strftime call; astimezone() always carries a named zone for %Z
+_RESTART_TEMPLATE = (
+    "<b>⌬ Restarted Successfully!</b>\n"
+    "<b>┟ Date: %Y-%m-%d</b>\n"
+    "<b>┠ Time: %H:%M:%S</b>\n"
+    "<b>┠ TimeZone: %Z</b>\n"
+    "<b>┖ Version: RickV1</b>"
+)
 
 def _build_restart_message() -> str:
-    now = datetime.now().astimezone()
-    date_str = now.strftime("%Y-%m-%d")
-    time_str = now.strftime("%H:%M:%S")
-    tzname = now.tzname() or "UTC"
-    return (
-        f"<b>⌬ Restarted Successfully!</b>\n"
-        f"<b>┟ Date: {date_str}</b>\n"
-        f"<b>┠ Time: {time_str}</b>\n"
-        f"<b>┠ TimeZone: {tzname}</b>\n"
-        f"<b>┖ Version: RickV1</b>"
-    )
+    return datetime.now().astimezone().strftime(_RESTART_TEMPLATE)
 
 # /whoami — help set OWNER_ID
 async def whoami(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -75,8 +79,12 @@ async def restart_cb(update: Update, context: ContextTypes.DEFAULT_TYPE):
         except Exception:
             pass
 
-        # Hard exit after 1s → Heroku will restart the dyno
-        def _hard_exit():
-            os._exit(0)
-
-        Timer(1.0, _hard_exit).start()
+        # Stop polling after 1s: run_polling then runs post_shutdown (closing the HTTP
+        # sessions) and returns, the process exits and Heroku restarts the dyno.
+        # The hard exit runs on a daemon thread, so it still fires if that shutdown hangs
+        # (loop timers would be dropped once the loop closes) and never keeps a clean
+        # exit waiting.
+        asyncio.get_running_loop().call_later(1.0, context.application.stop_running)
+        backstop = threading.Timer(_HARD_EXIT_AFTER, os._exit, args=(0,))
+        backstop.daemon = True
+        backstop.start()
@@ -1,5 +1,7 @@
 import html
 import logging
+import time
+from typing import Dict, Tuple
 from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
@@ -13,6 +15,18 @@ def _maybe_dev_kb():
         return InlineKeyboardMarkup([[InlineKeyboardButton("🤓 Bot Developer", url=DEV_LINK)]])
     return None
 
+# Only the user's name varies in the /start text: one %-substitution per /start
+_START_TEMPLATE = (
+    "<b>── ⋅ ⋅ ── ✩ ── ⋅ ⋅ ──╮</b>\n"
+    "<b>╰┈➤  RICK BOT 🤖</b>\n\n"
+    "<b>Hello %s!</b>\n\n"
+    "<b>I am a Google Drive → GDFlix Poster & Audio Info Generator Bot</b>\n\n"
+    "<b>➥ Developed By: @J1_CHANG_WOOK</b>\n"
+    "<b>➥ Details: /help</b>\n\n"
+    "<b>╰── ⋅ ⋅ ─ ✩ ── ⋅ ⋅ ─╯</b>"
+)
+_START_KB = _maybe_dev_kb()
+
 # /start (unchanged)
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_user:
@@ -20,16 +34,8 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     user = update.effective_user
     name = html.escape(user.first_name or "User")
-    text = (
-        "<b>── ⋅ ⋅ ── ✩ ── ⋅ ⋅ ──╮</b>\n"
-        "<b>╰┈➤  RICK BOT 🤖</b>\n\n"
-        f"<b>Hello {name}!</b>\n\n"
-        "<b>I am a Google Drive → GDFlix Poster & Audio Info Generator Bot</b>\n\n"
-        "<b>➥ Developed By: @J1_CHANG_WOOK</b>\n"
-        "<b>➥ Details: /help</b>\n\n"
-        "<b>╰── ⋅ ⋅ ─ ✩ ── ⋅ ⋅ ─╯</b>"
-    )
-    kb = _maybe_dev_kb()
+    text = _START_TEMPLATE % name
+    kb = _START_KB
 
     if START_PHOTO_URL:
         try:
@@ -49,70 +55,81 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
         reply_markup=kb if kb else None,
     )
 
-# Bold text builders (escape content to avoid HTML parse errors)
+# Bold text builders (escape content to avoid HTML parse errors); the static help
+# texts below are rendered once at import and reused by every /help click
 def _bold_lines(lines: list[str]) -> str:
-    return "\n".join(f"<b>{html.escape(l)}</b>" if l.strip() else "" for l in lines)
-
-def _ott_commands_text() -> str:
-    return _bold_lines([
-        "OTT - COMMANDS",
-        "• /amzn - Amazon Prime Video",
-        "• /nf - Netflix",
-        "• /snxt - SunNXT",
-        "• /zee5 - Zee5",
-        "• /aha - AhaVideo",
-        "• /viki - Viki",
-        "• /sl - SonyLiv",
-        "• /hbo - HboMax",
-        "• /up - UltraPlay",
-        "• /iq - IQIYI",
-        "• /hulu - Hulu",
-        "• /apple - AppleTv",
-        "• /dsnp - Disney+",
-    ])
-
-def _gd_commands_text() -> str:
-    return _bold_lines([
-        "GOOGLE DRIVE / DIRECT LINKS",
-        "• /get – GDrive → GDFlix link + TMDB + MediaInfo",
-        "• /rk - Post Replay to Any Ott link Send Get (Ott Poster with info)",
-        "• /info – Direct link → TMDB + Audio Info",
-        "• /ls – GDrive/Workers → GDFlix + TMDB + Audio Info",
-        "• /tmdb – TMDB title/year/poster",
-    ])
-
-def _ucer_help_text() -> str:
-    return _bold_lines([
-        "Ucer",
-        "• /start - Bot Dead Or Alive",
-        "• /ucer - Ucer Settings",
-        "• /amzn - Amazon Prime Video",
-        "• /nf - Netflix",
-        "• /snxt - SunNXT",
-        "• /zee5 - Zee5",
-        "• /aha - AhaVideo",
-        "• /viki - Viki",
-        "• /sl - SonyLiv",
-        "• /hbo - HboMax",
-        "• /up - UltraPlay",
-        "• /iq - IQIYI",
-        "• /hulu - Hulu",
-        "• /apple - AppleTv",
-        "• /dsnp - Disney+",
-        "",
-        "▣ Help Section!!",
-        "◉ Check Button For Command",
-        "◉ Need Assistance?",
-        "~ If you are facing any problems, please ask the admin for help.",
-    ])
-
-def _admin_help_text() -> str:
-    return _bold_lines([
-        "ADMIN COMMANDS",
-        "• /authorize – (Owner only) Authorize this group",
-        "• /allow <user_id> – (Owner only) Allow a user",
-        "• /deny <user_id> – (Owner only) Revoke a user",
-    ])
+    return "\n".join("<b>" + html.escape(l) + "</b>" if l.strip() else "" for l in lines)
+
+_OTT_TEXT = _bold_lines([
+    "OTT - COMMANDS",
+    "• /amzn - Amazon Prime Video",
+    "• /nf - Netflix",
+    "• /snxt - SunNXT",
+    "• /zee5 - Zee5",
+    "• /aha - AhaVideo",
+    "• /viki - Viki",
+    "• /sl - SonyLiv",
+    "• /hbo - HboMax",
+    "• /up - UltraPlay",
+    "• /iq - IQIYI",
+    "• /hulu - Hulu",
+    "• /apple - AppleTv",
+    "• /dsnp - Disney+",
+])
+
+_GD_TEXT = _bold_lines([
+    "GOOGLE DRIVE / DIRECT LINKS",
+    "• /get – GDrive → GDFlix link + TMDB + MediaInfo",
+    "• /rk - Post Replay to Any Ott link Send Get (Ott Poster with info)",
+    "• /info – Direct link → TMDB + Audio Info",
+    "• /ls – GDrive/Workers → GDFlix + TMDB + Audio Info",
+    "• /tmdb – TMDB title/year/poster",
+])
+
+_UCER_TEXT = _bold_lines([
+    "Ucer",
+    "• /start - Bot Dead Or Alive",
+    "• /ucer - Ucer Settings",
+    "• /amzn - Amazon Prime Video",
+    "• /nf - Netflix",
+    "• /snxt - SunNXT",
+    "• /zee5 - Zee5",
+    "• /aha - AhaVideo",
+    "• /viki - Viki",
+    "• /sl - SonyLiv",
+    "• /hbo - HboMax",
+    "• /up - UltraPlay",
+    "• /iq - IQIYI",
+    "• /hulu - Hulu",
+    "• /apple - AppleTv",
+    "• /dsnp - Disney+",
+    "",
+    "▣ Help Section!!",
+    "◉ Check Button For Command",
+    "◉ Need Assistance?",
+    "~ If you are facing any problems, please ask the admin for help.",
+])
+
+_ADMIN_TEXT = _bold_lines([
+    "ADMIN COMMANDS",
+    "• /authorize – (Owner only) Authorize this group",
+    "• /allow <user_id> – (Owner only) Allow a user",
+    "• /deny <user_id> – (Owner only) Revoke a user",
+])
+
+_HELP_TEXTS = {
+    "help:ott": _OTT_TEXT,
+    "help:gd": _GD_TEXT,
+    "help:ucer": _UCER_TEXT,
+    "help:admin": _ADMIN_TEXT,
+}
+_UNKNOWN_TEXT = _bold_lines(["Unknown selection."])
+
+_HELP_CAPTION = _bold_lines([
+    "🤖 GDFlix TMDB Bot – HELP MENU",
+    "",
+    "Use the buttons below to view commands by category.",
+])
 
 # /help keyboard (side-by-side buttons)
 def _help_keyboard() -> InlineKeyboardMarkup:
@@ -130,16 +147,15 @@ def _help_keyboard() -> InlineKeyboardMarkup:
         rows.append([InlineKeyboardButton("🤓 Bot Developer", url=DEV_LINK)])
     return InlineKeyboardMarkup(rows)
 
+# Built from config only, so one instance serves every /help
+_HELP_KB = _help_keyboard()
+
 async def help_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if update.effective_user:
         track_user(update.effective_user.id)
 
-    caption = _bold_lines([
-        "🤖 GDFlix TMDB Bot – HELP MENU",
-        "",
-        "Use the buttons below to view commands by category.",
-    ])
-    kb = _help_keyboard()
+    caption = _HELP_CAPTION
+    kb = _HELP_KB
 
     if HELP_PHOTO_URL:
         try:
@@ -159,6 +175,24 @@ async def help_cmd(update: Update, context: ContextTypes.DEFAULT_TYPE):
         reply_markup=kb,
     )
 
+# The first click on a help button is answered at once; repeats of the same button
+# in the same chat within this window are dropped
+_HELP_REPEAT_WINDOW = 0.5
+# (chat_id, callback data) -> monotonic time until which repeats are dropped
+_recent_help: Dict[Tuple[int, str], float] = {}
+
+async def _send_help_text(message, text: str) -> None:
+    try:
+        # Reply in the same chat thread as the button message
+        await message.reply_text(text, parse_mode=ParseMode.HTML)
+    except Exception as e:
+        logger.warning(f"help_cb send failed: {e}")
+        # Fallback: send a plain text message without HTML
+        try:
+            await message.reply_text(html.unescape(text))
+        except Exception:
+            pass
+
 # Help callbacks
 async def help_cb(update: Update, context: ContextTypes.DEFAULT_TYPE):
     q = update.callback_query
@@ -171,24 +205,11 @@ async def help_cb(update: Update, context: ContextTypes.DEFAULT_TYPE):
     except Exception:
         pass
 
-    if data == "help:ott":
-        text = _ott_commands_text()
-    elif data == "help:gd":
-        text = _gd_commands_text()
-    elif data == "help:ucer":
-        text = _ucer_help_text()
-    elif data == "help:admin":
-        text = _admin_help_text()
-    else:
-        text = _bold_lines(["Unknown selection."])
-
-    try:
-        # Reply in the same chat thread as the button message
-        await q.message.reply_text(text, parse_mode=ParseMode.HTML)
-    except Exception as e:
-        logger.warning(f"help_cb send failed: {e}")
-        # Fallback: send a plain text message without HTML
-        try:
-            await q.message.reply_text(html.unescape(text))
-        except Exception:
-            pass
+    key = (q.message.chat_id, data)
+    now = time.monotonic()
+    if _recent_help.get(key, 0.0) > now:
+        return
+    for k in [k for k, until in _recent_help.items() if until <= now]:
+        del _recent_help[k]
+    _recent_help[key] = now + _HELP_REPEAT_WINDOW
+    await _send_help_text(q.message, _HELP_TEXTS.get(data, _UNKNOWN_TEXT))
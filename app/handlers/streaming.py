@@ -1,15 +1,20 @@
+import asyncio
 import html
 import re
+import statistics
+import time
 import urllib.parse
-import requests
-from io import BytesIO
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import aiohttp
+import orjson
 from telegram import Update
 from telegram.constants import ParseMode
 from telegram.ext import ContextTypes
 
 from app.config import NETFLIX_API
 from app.state import track_user
-from app.utils import download_bytes, ensure_line_bold
 
 STREAM_APIS = {
     "primevideo.com": "https://amzn.rickheroko.workers.dev/?url={encoded}",
@@ -30,6 +35,96 @@ STREAM_APIS = {
     "tentkotta": "https://tentkotta.rickheroko.workers.dev/?url={encoded}",
 }
 
+_session: Optional[aiohttp.ClientSession] = None
+
+def _get_session() -> aiohttp.ClientSession:
+    """Shared session for the poster workers, created lazily inside the running loop."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30),
+            headers={"Accept": "application/json"},
+        )
+    return _session
+
+async def close_session() -> None:
+    """Close the shared session on shutdown so pooled sockets are released cleanly."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+async def _get_json(api: str) -> Any:
+    # Non-blocking: concurrent commands overlap on the network instead of queueing
+    async with _get_session().get(api) as r:
+        r.raise_for_status()
+        return orjson.loads(await r.read())
+
+# API URL -> (expires_at, parsed JSON); bounded LRU. Repeat lookups of the same title
+# (common in groups) skip the worker entirely for half an hour.
+_API_CACHE: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+_API_CACHE_MAX = 2048
+_API_TTL = 1800
+# API URL -> future of the request currently running for it (singleflight)
+_API_INFLIGHT: Dict[str, asyncio.Future] = {}
+
+async def _get_json_cached(api: str) -> Any:
+    """_get_json with a TTL cache; concurrent identical requests share one call."""
+    hit = _API_CACHE.get(api)
+    if hit is not None:
+        if time.monotonic() < hit[0]:
+            _API_CACHE.move_to_end(api)
+            return hit[1]
+        del _API_CACHE[api]
+    pending = _API_INFLIGHT.get(api)
+    if pending is not None:
+        return await asyncio.shield(pending)
+    fut = asyncio.get_running_loop().create_future()
+    _API_INFLIGHT[api] = fut
+    try:
+        data = await _get_json(api)
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved when nobody else was waiting
+        raise
+    finally:
+        _API_INFLIGHT.pop(api, None)
+    # Only real answers are kept; worker error bodies are retried next time
+    if isinstance(data, dict) and data and "error" not in data:
+        _API_CACHE[api] = (time.monotonic() + _API_TTL, data)
+        while len(_API_CACHE) > _API_CACHE_MAX:
+            _API_CACHE.popitem(last=False)
+    fut.set_result(data)
+    return data
+
+# Recent worker latencies per API template; the "Fetching..." status message is only
+# worth its two Telegram calls when the answer isn't cached and the worker is slow.
+_API_LATENCY: Dict[str, Deque[float]] = {}
+_API_LATENCY_SAMPLES = 20
+_SLOW_API_P50 = 0.8
+
+def _expect_fast(api: str, base_api: str) -> bool:
+    hit = _API_CACHE.get(api)
+    if hit is not None and time.monotonic() < hit[0]:
+        return True
+    samples = _API_LATENCY.get(base_api)
+    return bool(samples) and statistics.median(samples) < _SLOW_API_P50
+
+async def _fetch_api(api: str, base_api: str) -> Any:
+    """_get_json_cached, recording how long the worker took on a cache miss."""
+    hit = _API_CACHE.get(api)
+    if hit is not None and time.monotonic() < hit[0]:
+        return await _get_json_cached(api)
+    started = time.monotonic()
+    try:
+        return await _get_json_cached(api)
+    finally:
+        # Failures count too, so a worker that keeps timing out brings the status back
+        _API_LATENCY.setdefault(base_api, deque(maxlen=_API_LATENCY_SAMPLES)).append(time.monotonic() - started)
+
 async def generic_stream(update: Update, context: ContextTypes.DEFAULT_TYPE, label_landscape: str, label_portrait: str, base_api: str):
     track_user(update.effective_user.id)
     url = " ".join(context.args) if context.args else ""
@@ -41,13 +136,13 @@ async def generic_stream(update: Update, context: ContextTypes.DEFAULT_TYPE, lab
 
     encoded = urllib.parse.quote_plus(url)
     api = base_api.format(encoded=encoded)
-    msg = await update.message.reply_text("🔍 Fetching...")
+    msg = None if _expect_fast(api, base_api) else await update.message.reply_text("🔍 Fetching...")
+    # Edit the status message when there is one, otherwise answer directly
+    send = msg.edit_text if msg else update.message.reply_text
     try:
-        r = requests.get(api, timeout=30)
-        r.raise_for_status()
-        data = r.json()
+        data = await _fetch_api(api, base_api)
     except Exception as e:
-        await msg.edit_text(f"❌ Failed:\n<code>{html.escape(str(e))}</code>", parse_mode=ParseMode.HTML)
+        await send(f"❌ Failed:\n<code>{html.escape(str(e))}</code>", parse_mode=ParseMode.HTML)
         return
 
     title = data.get("title") or data.get("name") or "Unknown"
@@ -61,7 +156,7 @@ async def generic_stream(update: Update, context: ContextTypes.DEFAULT_TYPE, lab
         f"<b>{html.escape(title)}{(' - (' + str(year) + ')') if year else ''}</b>\n\n"
         "<b><blockquote>Powered By: <a href='https://t.me/ott_posters_club'>Ott Posters Club 🎞️</a></blockquote></b>"
     )
-    await msg.edit_text(text, parse_mode=ParseMode.HTML, disable_web_page_preview=False)
+    await send(text, parse_mode=ParseMode.HTML, disable_web_page_preview=False)
 
 # Individual command wrappers
 async def amzn(update, context):  await generic_stream(update, context, "AMZN Poster:", "Portrait:", STREAM_APIS["primevideo.com"])
@@ -83,6 +178,9 @@ async def wetv(update, context):  await generic_stream(update, context, "WeTv Po
 async def sl(update, context):    await generic_stream(update, context, "SonyLiv Poster:", "Portrait:", "https://sonyliv.rickheroko.workers.dev/?url={encoded}")
 async def tk(update, context):    await generic_stream(update, context, "TentKotta Poster:", "Portrait:", "https://tentkotta.rickheroko.workers.dev/?url={encoded}")
 
+_NF_TITLE_RE = re.compile(r"/title/(\d+)")
+_DIGITS_RE = re.compile(r"\d+")
+
 async def nf(update: Update, context: ContextTypes.DEFAULT_TYPE):
     track_user(update.effective_user.id)
     raw = " ".join(context.args).strip() if context.args else ""
@@ -91,22 +189,24 @@ async def nf(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
     movie_id = None
     if raw.startswith("http"):
-        m = re.search(r"/title/(\d+)", raw)
+        m = _NF_TITLE_RE.search(raw)
         if m: movie_id = m.group(1)
-    if not movie_id and re.fullmatch(r"\d+", raw):
+    if not movie_id and _DIGITS_RE.fullmatch(raw):
         movie_id = raw
     if not movie_id:
         await update.message.reply_text("Could not extract Netflix movie id.")
         return
 
     api_url = f"{NETFLIX_API}{movie_id}"
-    status_msg = await update.message.reply_text("🔍 Fetching Netflix data…")
+    status_msg = None
+    if not _expect_fast(api_url, NETFLIX_API):
+        status_msg = await update.message.reply_text("🔍 Fetching Netflix data…")
     try:
-        r = requests.get(api_url, timeout=30); r.raise_for_status()
-        data = r.json()
+        data = await _fetch_api(api_url, NETFLIX_API)
     except Exception as e:
-        try: await status_msg.delete()
-        except Exception: pass
+        if status_msg:
+            try: await status_msg.delete()
+            except Exception: pass
         await update.message.reply_text(f"❌ Netflix API error:\n<code>{html.escape(str(e))}</code>", parse_mode=ParseMode.HTML)
         return
 
@@ -123,86 +223,3 @@ async def nf(update: Update, context: ContextTypes.DEFAULT_TYPE):
         "<b><blockquote>Powered By: <a href='https://t.me/ott_posters_club'>Ott Posters Club 🎞️</a></blockquote></b>"
     )
     await update.message.reply_text(text, parse_mode=ParseMode.HTML, disable_web_page_preview=False)
-
-# NEW: /rk — reply-based poster resend with same caption
-async def rk(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    track_user(update.effective_user.id)
-    msg = update.message
-
-    # Must be used as reply
-    if not msg.reply_to_message:
-        await msg.reply_text("❌ /rk must be used as a reply to a previous captioned message")
-        return
-
-    if not context.args:
-        await msg.reply_text("❌ Usage:\n/rk <streaming url>")
-        return
-
-    stream_url = context.args[0].strip()
-    # Base caption from replied message
-    base_caption = msg.reply_to_message.caption or msg.reply_to_message.text
-    if not base_caption:
-        await msg.reply_text("❌ Replied message has no caption")
-        return
-
-    # Full boldify (normalize ' - [' to ' [')
-    bold_lines = []
-    for line in base_caption.splitlines():
-        s = re.sub(r"\s*-\s*\[", " [", line)
-        bold_lines.append(ensure_line_bold(s) if s.strip() else "")
-    final_caption = "\n".join(bold_lines)
-
-    # Detect platform → API
-    encoded = urllib.parse.quote_plus(stream_url)
-    api_url = None
-    for key, templ in STREAM_APIS.items():
-        if key in stream_url:
-            api_url = templ.format(encoded=encoded)
-            break
-    # Netflix direct id/url special case
-    if not api_url and ("netflix.com" in stream_url or re.fullmatch(r"\d{6,}", stream_url)):
-        # Allow `/rk 12345678`
-        movie_id = None
-        m = re.search(r"/title/(\d+)", stream_url)
-        if m:
-            movie_id = m.group(1)
-        elif re.fullmatch(r"\d+", stream_url):
-            movie_id = stream_url
-        if movie_id:
-            api_url = f"{NETFLIX_API}{movie_id}"
-
-    if not api_url:
-        await msg.reply_text("❌ Unsupported or unknown streaming platform URL")
-        return
-
-    status = await msg.reply_text("🔍 Fetching streaming poster...")
-
-    try:
-        r = requests.get(api_url, timeout=30)
-        r.raise_for_status()
-        data = r.json()
-    except Exception as e:
-        await status.edit_text(f"❌ API error\n<code>{html.escape(str(e))}</code>", parse_mode=ParseMode.HTML)
-        return
-
-    # Landscape poster only
-    landscape = data.get("landscape") or data.get("backdrop") or data.get("horizontal") or data.get("cover")
-    if not landscape:
-        await status.edit_text("❌ Landscape poster not found")
-        return
-
-    poster_bytes = download_bytes(landscape)
-    if not poster_bytes:
-        await status.edit_text("❌ Poster download failed")
-        return
-
-    bio = BytesIO(poster_bytes)
-    bio.name = "streaming_landscape.jpg"
-
-    try:
-        await status.delete()
-    except Exception:
-        pass
-
-    # Send to the replied message thread with the SAME caption
-    await msg.reply_to_message.reply_photo(photo=bio, caption=final_caption, parse_mode=ParseMode.HTML)
@@ -5,6 +5,7 @@ from telegram.ext import (
 
 from app.config import TELEGRAM_BOT_TOKEN
 from app.handlers import start_help, core, streaming, ucer, admin, posters_ui, restart, bs, repost
+from app.services import tmdb_async
 from app.state import load_state
 
 
@@ -36,7 +37,7 @@ async def callback_router(update, context):
         return await ucer.ucer_cb(update, context)
     if data.startswith("admin:"):
         return await admin.admin_cb(update, context)
-    if data.startswith("poster:"):
+    if data.startswith(("p:", "poster:")):
         return await posters_ui.posters_cb(update, context)
     if data.startswith("bs:"):
         return await bs.bs_cb(update, context)
@@ -50,6 +51,16 @@ async def callback_router(update, context):
         pass
 
 
+async def post_init(app):
+    await repost.open_session(app)
+
+
+async def post_shutdown(app):
+    await tmdb_async.close_session()
+    await streaming.close_session()
+    await repost.close_session(app)
+
+
 def main():
     setup_logging()
     load_state()
@@ -58,13 +69,13 @@ def main():
         print("Set TELEGRAM_BOT_TOKEN env first!")
         return
 
-    app = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).build()
+    app = ApplicationBuilder().token(TELEGRAM_BOT_TOKEN).post_init(post_init).post_shutdown(post_shutdown).build()
 
     # Basic
     app.add_handler(CommandHandler("start", start_help.start, block=False))
     app.add_handler(CommandHandler("help", start_help.help_cmd, block=False))
 
-    # Single catch-all callback router (handles help:, ucer:, admin:, bs:, poster:, restart:)
+    # Single catch-all callback router (handles help:, ucer:, admin:, bs:, p:/poster:, restart:)
     app.add_handler(CallbackQueryHandler(callback_router, block=False))
 
     # Access control
@@ -1,8 +1,11 @@
 import logging
 import re
-import requests
 from typing import Optional, Tuple
+
+import orjson
+
 from app.config import TMDB_API_KEY
+from app.utils import SESSION
 
 logger = logging.getLogger(__name__)
 
@@ -69,9 +72,9 @@ def strict_match(raw_title: str, year: str):
         params = {"api_key": TMDB_API_KEY, "query": search_title, "include_adult": "false", "page": 1}
         if have_year: params["year"] = year
         try:
-            r = requests.get("https://api.themoviedb.org/3/search/movie", params=params, timeout=10)
+            r = SESSION.get("https://api.themoviedb.org/3/search/movie", params=params, timeout=10)
             if r.status_code != 200: return []
-            results = r.json().get("results") or []
+            results = orjson.loads(r.content).get("results") or []
             if not have_year: return results
             return [it for it in results if (it.get("release_date") or "")[:4] == year]
         except Exception:
@@ -81,9 +84,9 @@ def strict_match(raw_title: str, year: str):
         params = {"api_key": TMDB_API_KEY, "query": search_title, "include_adult": "false", "page": 1}
         if have_year: params["first_air_date_year"] = year
         try:
-            r = requests.get("https://api.themoviedb.org/3/search/tv", params=params, timeout=10)
+            r = SESSION.get("https://api.themoviedb.org/3/search/tv", params=params, timeout=10)
             if r.status_code != 200: return []
-            results = r.json().get("results") or []
+            results = orjson.loads(r.content).get("results") or []
             if not have_year: return results
             return [it for it in results if (it.get("first_air_date") or "")[:4] == year]
         except Exception:
@@ -100,11 +103,11 @@ def strict_match(raw_title: str, year: str):
 
     if not item and not have_year:
         try:
-            r = requests.get("https://api.themoviedb.org/3/search/multi",
+            r = SESSION.get("https://api.themoviedb.org/3/search/multi",
                              params={"api_key": TMDB_API_KEY, "query": search_title, "include_adult": "false", "page": 1},
                              timeout=10)
             if r.status_code == 200:
-                res = r.json().get("results") or []
+                res = orjson.loads(r.content).get("results") or []
                 if res:
                     item = res[0]
                     mt = item.get("media_type")
@@ -145,9 +148,9 @@ def backdrop_from_tmdb_url(tmdb_url: str | None) -> Optional[str]:
     ctype, tmdb_id = m.group(1), m.group(2)
     try:
         api_url = f"https://api.themoviedb.org/3/{ctype}/{tmdb_id}/images"
-        r = requests.get(api_url, params={"api_key": TMDB_API_KEY, "include_image_language": "en,null"}, timeout=10)
+        r = SESSION.get(api_url, params={"api_key": TMDB_API_KEY, "include_image_language": "en,null"}, timeout=10)
         if r.status_code != 200: return None
-        backdrops = r.json().get("backdrops") or []
+        backdrops = orjson.loads(r.content).get("backdrops") or []
         if not backdrops: return None
         chosen = next((b for b in backdrops if b.get("iso_639_1") == "en"), None)
         if not chosen:
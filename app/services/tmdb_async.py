@@ -0,0 +1,210 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Set, Tuple
+
+import aiohttp
+import orjson
+
+from app.config import TMDB_API_KEY
+
+logger = logging.getLogger(__name__)
+
+TMDB_API = "https://api.themoviedb.org/3"
+
+DETAILS_TTL = 24 * 3600
+IMAGES_TTL = 3600
+_CACHE_MAX = 2048
+
+# TMDB's rate limit is per IP, around 50 req/s (the old 40 per 10 s cap is gone).
+# At most 30 requests in flight, and a token bucket starting at most 40 per second
+# (bursts up to 40) keeps us under it; 429/5xx are retried with backoff.
+_TMDB_SEM = asyncio.Semaphore(30)
+_RATE_TOKENS = 40
+_RATE_PERIOD = 1.0
+_bucket = {"tokens": float(_RATE_TOKENS), "at": 0.0}
+_bucket_lock = asyncio.Lock()
+_RETRIES = 4
+_RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+_session: Optional[aiohttp.ClientSession] = None
+
+# key -> (fresh_until, stale_until, value); insertion order doubles as age for pruning.
+# Between the two deadlines the old value is served while a refresh runs in the background.
+_cache: Dict[Hashable, Tuple[float, float, Any]] = {}
+# (path, params) -> (ETag, parsed body) of the last 200, for conditional refreshes.
+# Only details/images paths, which are cached and refreshed; one-off /search queries
+# would just pin their bodies. Kept well below _CACHE_MAX since bodies can be large.
+_etags: Dict[Hashable, Tuple[str, Any]] = {}
+_ETAGS_MAX = 512
+_NO_ETAG_PREFIXES = ("/search/",)
+# key -> future of the fetch currently running for it (singleflight)
+_inflight: Dict[Hashable, asyncio.Future] = {}
+# strong refs so background refreshes aren't garbage-collected mid-flight
+_refreshing: Set[asyncio.Task] = set()
+
+def get_session() -> aiohttp.ClientSession:
+    """Shared TMDB session, created lazily on first use inside the running loop."""
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(limit=64, limit_per_host=16, keepalive_timeout=60)
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+async def close_session() -> None:
+    """Close the shared session on shutdown so pooled sockets are released cleanly."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+async def _acquire_token() -> None:
+    """Wait until the bucket holds a token, then take it. Callers queue FIFO on the lock."""
+    rate = _RATE_TOKENS / _RATE_PERIOD
+    async with _bucket_lock:
+        while True:
+            now = time.monotonic()
+            tokens = min(_RATE_TOKENS, _bucket["tokens"] + (now - _bucket["at"]) * rate)
+            _bucket["at"] = now
+            if tokens >= 1:
+                _bucket["tokens"] = tokens - 1
+                return
+            _bucket["tokens"] = tokens
+            await asyncio.sleep((1 - tokens) / rate)
+
+async def get_json(path: str, **params) -> Tuple[int, Optional[Any]]:
+    """
+    GET `TMDB_API + path` with the API key added.
+    Returns (http_status, parsed JSON); JSON is None for non-200 responses.
+    Bodies are revalidated with If-None-Match, so a refresh of unchanged data is a 304.
+    At most 30 requests are in flight and 40 start per second; 429/5xx are retried up to 4 times.
+    """
+    use_etag = not path.startswith(_NO_ETAG_PREFIXES)
+    etag_key = (path, tuple(sorted(params.items())))
+    params["api_key"] = TMDB_API_KEY
+    for attempt in range(_RETRIES):
+        # A slot is held per attempt only, so backoff sleeps don't starve other calls
+        async with _TMDB_SEM:
+            await _acquire_token()
+            known = _etags.get(etag_key) if use_etag else None
+            async with get_session().get(
+                f"{TMDB_API}{path}",
+                params=params,
+                headers={"If-None-Match": known[0]} if known else None,
+                timeout=aiohttp.ClientTimeout(total=10),
+            ) as r:
+                if r.status == 304 and known:
+                    return 200, known[1]
+                if r.status == 200:
+                    js = orjson.loads(await r.read())
+                    if use_etag:
+                        _remember_etag(etag_key, r.headers.get("ETag"), js)
+                    return r.status, js
+                if r.status not in _RETRY_STATUSES or attempt == _RETRIES - 1:
+                    return r.status, None
+                delay = _retry_delay(r.headers.get("Retry-After"), attempt)
+        logger.warning(f"TMDB HTTP {r.status} for {path}, retrying in {delay:.2f}s")
+        await asyncio.sleep(delay)
+    return r.status, None
+
+def _remember_etag(key: Hashable, etag: Optional[str], js: Any) -> None:
+    if not etag:
+        _etags.pop(key, None)
+        return
+    _etags.pop(key, None)
+    _etags[key] = (etag, js)
+    while len(_etags) > _ETAGS_MAX:
+        del _etags[next(iter(_etags))]
+
+def _retry_delay(retry_after: Optional[str], attempt: int) -> float:
+    """Honour a numeric Retry-After (capped); otherwise exponential backoff with jitter."""
+    if retry_after:
+        try:
+            return min(float(retry_after), 10.0)
+        except ValueError:
+            pass
+    return 2 ** attempt * 0.25 + random.random() * 0.1
+
+def _prune_cache() -> None:
+    now = time.monotonic()
+    for k in [k for k, (_, stale, _v) in _cache.items() if stale <= now]:
+        del _cache[k]
+    while len(_cache) >= _CACHE_MAX:
+        del _cache[next(iter(_cache))]
+
+def peek(key: Hashable) -> Optional[Any]:
+    """Cached value for `key` (fresh or still inside its stale window) without fetching."""
+    hit = _cache.get(key)
+    if hit and hit[1] > time.monotonic():
+        return hit[2]
+    return None
+
+def put(key: Hashable, ttl: float, value: Any) -> None:
+    """Store `value` under `key` directly, e.g. data that arrived as a by-product of another call."""
+    if len(_cache) >= _CACHE_MAX:
+        _prune_cache()
+    now = time.monotonic()
+    _cache.pop(key, None)
+    _cache[key] = (now + ttl, now + 2 * ttl, value)
+
+async def _fill(key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """Run `fetch()` once per key at a time (singleflight) and store a non-None result."""
+    pending = _inflight.get(key)
+    if pending is not None:
+        return await asyncio.shield(pending)
+    fut = asyncio.get_running_loop().create_future()
+    _inflight[key] = fut
+    try:
+        value = await fetch()
+    except asyncio.CancelledError:
+        fut.cancel()
+        raise
+    except Exception as e:
+        fut.set_exception(e)
+        fut.exception()  # mark retrieved when nobody else was waiting
+        raise
+    finally:
+        _inflight.pop(key, None)
+    if value is not None:
+        put(key, ttl, value)
+    fut.set_result(value)
+    return value
+
+async def _refresh(key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> None:
+    try:
+        await _fill(key, ttl, fetch)
+    except Exception as e:
+        logger.warning(f"Background refresh of {key!r} failed: {e}")
+
+async def cached(key: Hashable, ttl: float, fetch: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return the value cached under `key`, awaiting `fetch()` on a miss.
+    Once past `ttl` an entry is still served for another `ttl` while one background
+    refresh replaces it (stale-while-revalidate), so expiry never costs the user a round trip.
+    Concurrent misses for the same key await one shared future, so a burst
+    costs a single TMDB call. None results (failed lookups) are returned but never cached.
+    """
+    hit = _cache.get(key)
+    if hit:
+        now = time.monotonic()
+        if hit[0] > now:
+            return hit[2]
+        if hit[1] > now:
+            if key not in _inflight:
+                task = asyncio.get_running_loop().create_task(_refresh(key, ttl, fetch))
+                _refreshing.add(task)
+                task.add_done_callback(_refreshing.discard)
+            return hit[2]
+    return await _fill(key, ttl, fetch)
+
+async def download_bytes_async(url: str) -> Optional[bytes]:
+    """Fetch raw bytes (e.g. an image.tmdb.org poster) over the shared session."""
+    try:
+        async with get_session().get(url, timeout=aiohttp.ClientTimeout(total=20)) as r:
+            if r.status == 200:
+                return await r.read()
+            logger.warning(f"Download HTTP {r.status} for {url}")
+    except Exception as e:
+        logger.warning(f"Download failed: {e}")
+    return None
@@ -6,10 +6,29 @@ from typing import Optional
 
 import requests
 import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 logger = logging.getLogger(__name__)
 
+# Pooled keep-alive session for the sync helpers (TMDB API, image.tmdb.org, ...)
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    # Status retries only: a hung connect/read fails after one timeout instead of four.
+    # Once they run out the last 429/5xx is returned, not raised, so callers' status
+    # checks still see it; Retry-After is ignored so a worker thread never sleeps for
+    # minutes, and the backoff between tries stays under 2 s.
+    max_retries=Retry(
+        total=3, connect=0, read=0, backoff_factor=0.2, backoff_max=2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False, respect_retry_after_header=False,
+    ),
+))
+SESSION.headers["User-Agent"] = "rick-poster/1.0"
+
 def html_bold_lines(text: str) -> str:
     if not text:
         return ""
@@ -103,7 +122,7 @@ def download_bytes(url: str) -> Optional[bytes]:
     if not url:
         return None
     try:
-        r = requests.get(url, timeout=20)
+        r = SESSION.get(url, timeout=20)
         if r.status_code == 200 and r.content:
             return r.content
         logger.warning(f"Download HTTP {r.status_code} for {url}")
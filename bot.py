@@ -5,6 +5,13 @@ try:
 except Exception:
     pass
 
+# Optional libuv-backed event loop; the stock asyncio loop is used when it isn't installed.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 from app.main import main
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+import unittest
+
+from app.handlers.repost import _parse_landscape_from_json, _to_absolute_image_url
+
+
+class LandscapeJsonTest(unittest.TestCase):
+    def resolve(self, data):
+        candidate = _parse_landscape_from_json(data)
+        return _to_absolute_image_url(candidate) if candidate else None
+
+    def test_schemeless_host_candidate(self):
+        data = {"title": "Some Show", "landscape": "cdn.host.com/img/a.jpg"}
+        self.assertEqual(self.resolve(data), "https://cdn.host.com/img/a.jpg")
+
+    def test_bare_tmdb_file_path(self):
+        self.assertEqual(self.resolve({"backdrops": [{"file_path": "/a.jpg"}]}), "https://image.tmdb.org/a.jpg")
+        self.assertEqual(self.resolve({"backdrops": [{"file_path": "a.jpg"}]}), "https://image.tmdb.org/a.jpg")
+
+    def test_absolute_and_protocol_relative(self):
+        self.assertEqual(self.resolve({"image": "https://x.io/a.png?w=1"}), "https://x.io/a.png?w=1")
+        self.assertEqual(self.resolve({"image": "//x.io/a.webp"}), "https://x.io/a.webp")
+
+    def test_text_is_not_a_candidate(self):
+        self.assertIsNone(self.resolve({"title": "Poster for movie.jpg", "url": "not an image"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
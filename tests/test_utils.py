@@ -0,0 +1,45 @@
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from app.utils import SESSION
+
+
+class _Always503(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        self.send_response(503)
+        self.send_header("Retry-After", "600")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class SessionRetryTest(unittest.TestCase):
+    def setUp(self):
+        _Always503.hits = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Always503)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        # Same adapter (and Retry policy) as SESSION, mounted for the plain-http test server
+        self.session = requests.Session()
+        self.session.mount("http://", SESSION.get_adapter("https://"))
+
+    def tearDown(self):
+        self.session.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_persistent_503_is_returned_not_raised(self):
+        r = self.session.get(f"http://127.0.0.1:{self.server.server_port}/", timeout=5)
+        self.assertEqual(r.status_code, 503)
+        self.assertEqual(_Always503.hits, 4)  # first try + 3 retries, Retry-After ignored
+
+
+if __name__ == "__main__":
+    unittest.main()